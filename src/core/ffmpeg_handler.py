@@ -1,17 +1,164 @@
 """FFmpeg handler for video processing and silence detection"""
 
+import contextlib
+import os
+import queue
 import subprocess
 import re
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple, Optional, Callable
+from typing import List, Tuple, Optional, Callable, Dict, Set
 import json
 
+import numpy as np
+
+# Optional in-process decoding; falls back to the FFmpeg CLI when missing
+try:
+    import av
+except ImportError:
+    av = None
+
+# Compiled once; runs against every stderr line of long FFmpeg jobs
+_SILENCE_RE = re.compile(r'silence_(start|end):\s*([\d.]+)')
+
+# Silence analysis runs at this rate; speech energy sits
+# well below its Nyquist frequency
+_ANALYSIS_SAMPLE_RATE = 8000
+
+# PyAV silence detection checks the peak amplitude, over all channels, of
+# windows of this length, so a window is silent only when every sample of
+# every channel is below the threshold, as with FFmpeg's silencedetect
+_AV_WINDOW_SECONDS = 0.05
+
+# Raw PCM for Whisper is read from FFmpeg in blocks of this many samples
+_PCM_CHUNK_SAMPLES = 320000
+
+# Encode progress is parsed from a bounded queue and reported at most
+# this often (seconds)
+_PROGRESS_QUEUE_SIZE = 256
+_PROGRESS_INTERVAL = 0.1
+
+# Filter graphs longer than this are passed via -filter_complex_script
+_FILTER_SCRIPT_THRESHOLD = 60000
+
+# Encoder threads given to each concurrent clip export
+_THREADS_PER_CLIP = 2
+
+# Single segments longer than this (seconds) are encoded in parallel chunks
+_PARALLEL_ENCODE_MIN_DURATION = 600
+
+# Consumer GPUs cap concurrent hardware encode sessions; enforced per
+# handler, so videos processed in parallel share the budget
+_MAX_HW_ENCODE_SESSIONS = 3
+
+# Hardware H.264 encoders in order of preference, with quality settings
+# roughly matching libx264 at CRF 23
+_HW_ENCODERS = [
+    ('h264_nvenc', ['-preset', 'p4', '-cq', '23']),
+    ('h264_qsv', ['-preset', 'veryfast', '-global_quality', '23']),
+    ('h264_videotoolbox', ['-b:v', '8M']),
+]
+
+
 class FFmpegHandler:
     """Handles FFmpeg operations for video processing"""
 
-    def __init__(self, ffmpeg_path: str = "ffmpeg"):
+    def __init__(
+        self,
+        ffmpeg_path: str = "ffmpeg",
+        encoder_preset: str = "veryfast",
+        hardware_encoding: bool = True,
+        threads: int = 0
+    ):
         self.ffmpeg_path = ffmpeg_path
+        # CPU threads FFmpeg work may use in total; 0 means all cores
+        self.threads = threads or os.cpu_count() or 1
         self.ffprobe_path = "ffprobe"
+        self.encoder_preset = encoder_preset
+        self.hardware_encoding = hardware_encoding
+        self._encoder: Optional[Tuple[str, List[str]]] = None
+        self._encoder_lock = threading.Lock()
+        self._hw_sessions = threading.BoundedSemaphore(_MAX_HW_ENCODE_SESSIONS)
+        self.cancelled = False
+        # Long-running analysis processes, terminated by cancel(); several
+        # videos may be analysed at once
+        self._processes: Set[subprocess.Popen] = set()
+        self._probe_cache: Dict[str, dict] = {}
+
+    def cancel(self):
+        """Cancel running FFmpeg analysis"""
+        self.cancelled = True
+        for process in list(self._processes):
+            if process.poll() is None:
+                process.terminate()
+
+    def _choose_encoder(self) -> Tuple[str, List[str]]:
+        """Pick the fastest working H.264 encoder, probing FFmpeg once"""
+        with self._encoder_lock:
+            if self._encoder is not None:
+                return self._encoder
+
+            encoder = self._software_encoder()
+
+            if self.hardware_encoding:
+                try:
+                    result = subprocess.run(
+                        [self.ffmpeg_path, '-hide_banner', '-encoders'],
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                        timeout=10
+                    )
+                    for name, args in _HW_ENCODERS:
+                        if name in result.stdout and self._encoder_works(name):
+                            encoder = (name, args)
+                            break
+                except Exception:
+                    pass
+
+            self._encoder = encoder
+            return encoder
+
+    def _encoder_works(self, name: str) -> bool:
+        """Check that an encoder is usable, not just compiled in"""
+        cmd = [
+            self.ffmpeg_path,
+            '-hide_banner',
+            '-f', 'lavfi',
+            '-i', 'color=size=256x256:duration=0.1',
+            '-c:v', name,
+            '-f', 'null',
+            '-'
+        ]
+        try:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=15
+            )
+            return result.returncode == 0
+        except Exception:
+            return False
+
+    def _software_encoder(self) -> Tuple[str, List[str]]:
+        """libx264 with the configured preset"""
+        return ('libx264', ['-preset', self.encoder_preset, '-crf', '23'])
+
+    def _video_encoder_args(self, software: bool = False) -> List[str]:
+        """FFmpeg arguments selecting the video encoder"""
+        name, args = self._software_encoder() if software else self._choose_encoder()
+        return ['-c:v', name, *args]
+
+    def _encode_session(self):
+        """Hold one of the handler's hardware encode sessions, if needed"""
+        if self._choose_encoder()[0] == 'libx264':
+            return contextlib.nullcontext()
+        return self._hw_sessions
 
     def detect_silence(
         self,
@@ -35,55 +182,245 @@ class FFmpegHandler:
         if progress_callback:
             progress_callback("Analyzing audio for silence...")
 
+        if av is not None:
+            try:
+                silence_segments = self._detect_silence_av(
+                    video_path,
+                    threshold_db,
+                    min_duration
+                )
+                if self.cancelled:
+                    return []
+
+                if progress_callback:
+                    progress_callback(f"Found {len(silence_segments)} silent segments")
+
+                return silence_segments
+
+            except Exception:
+                # Fall back to the FFmpeg CLI for inputs PyAV can't handle
+                pass
+
+        # Only the first audio stream is needed, so skip video/subtitle/data
+        # decoding; that audio is still decoded in full. It is decimated
+        # before silencedetect so the filter scans fewer samples, but keeps
+        # its channel layout: silencedetect only reports silence when every
+        # channel is below the threshold, and a downmix would lower a
+        # one-sided mic under it.
         cmd = [
             self.ffmpeg_path,
+            '-hide_banner',
+            '-nostats',
+            '-loglevel', 'info',
+            '-threads', '0',
             '-i', video_path,
-            '-af', f'silencedetect=noise={threshold_db}dB:d={min_duration}',
+            '-vn', '-sn', '-dn',
+            '-map', '0:a:0',
+            '-af', (
+                f'aresample={_ANALYSIS_SAMPLE_RATE},'
+                f'silencedetect=noise={threshold_db}dB:d={min_duration}'
+            ),
             '-f', 'null',
             '-'
         ]
 
+        process = None
         try:
-            result = subprocess.run(
+            # Stream stderr line by line instead of buffering the whole log
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=None
+                bufsize=1
             )
+            self._processes.add(process)
 
             # Parse silence detection output
             silence_segments = []
             silence_start = None
 
-            for line in result.stderr.split('\n'):
-                if 'silence_start' in line:
-                    match = re.search(r'silence_start: ([\d.]+)', line)
-                    if match:
-                        silence_start = float(match.group(1))
+            for line in process.stderr:
+                if self.cancelled:
+                    process.terminate()
+                    break
+
+                # Cheap substring check before running the regex
+                if 'silence_' not in line:
+                    continue
 
-                elif 'silence_end' in line and silence_start is not None:
-                    match = re.search(r'silence_end: ([\d.]+)', line)
-                    if match:
-                        silence_end = float(match.group(1))
-                        silence_segments.append((silence_start, silence_end))
-                        silence_start = None
+                match = _SILENCE_RE.search(line)
+                if not match:
+                    continue
+
+                if match.group(1) == 'start':
+                    silence_start = float(match.group(2))
+                elif silence_start is not None:
+                    silence_segments.append((silence_start, float(match.group(2))))
+                    silence_start = None
+
+            process.wait()
+
+            if self.cancelled:
+                return []
 
             if progress_callback:
                 progress_callback(f"Found {len(silence_segments)} silent segments")
 
             return silence_segments
 
-        except subprocess.TimeoutExpired:
-            if progress_callback:
-                progress_callback("Error: Processing timeout")
-            return []
         except Exception as e:
             if progress_callback:
                 progress_callback(f"Error detecting silence: {str(e)}")
             return []
 
+        finally:
+            self._processes.discard(process)
+
+    def _detect_silence_av(
+        self,
+        video_path: str,
+        threshold_db: float,
+        min_duration: float
+    ) -> List[Tuple[float, float]]:
+        """Detect silence in-process by decoding audio with PyAV"""
+        threshold = 10 ** (threshold_db / 20)
+        window = int(_ANALYSIS_SAMPLE_RATE * _AV_WINDOW_SECONDS)
+        window_seconds = window / _ANALYSIS_SAMPLE_RATE
+
+        silence_segments = []
+        silence_start = None
+        scanned_end = 0.0  # timestamp just past the last scanned window
+        pending = np.empty(0, dtype=np.float32)
+        pending_start = None  # timestamp of pending[0]
+
+        def scan(samples: np.ndarray, start: float) -> int:
+            """Scan whole windows of per-sample peaks starting at start; return samples used"""
+            nonlocal silence_start, scanned_end
+            usable = len(samples) - len(samples) % window
+            if not usable:
+                return 0
+            blocks = samples[:usable].reshape(-1, window)
+            peaks = np.max(blocks, axis=1)
+            for i, quiet in enumerate(peaks < threshold):
+                position = start + i * window_seconds
+                if quiet and silence_start is None:
+                    silence_start = position
+                elif not quiet and silence_start is not None:
+                    if position - silence_start >= min_duration:
+                        silence_segments.append((silence_start, position))
+                    silence_start = None
+            scanned_end = start + usable / _ANALYSIS_SAMPLE_RATE
+            return usable
+
+        def feed(resampled):
+            nonlocal pending, pending_start
+            if resampled.pts is not None:
+                # Timestamps match silencedetect and the -ss cuts, which see
+                # the input shifted so the container starts at zero
+                timestamp = float(resampled.pts * resampled.time_base) - start_offset
+                expected = (
+                    pending_start + len(pending) / _ANALYSIS_SAMPLE_RATE
+                    if pending_start is not None else None
+                )
+                if expected is None or abs(timestamp - expected) > window_seconds:
+                    # First frame or a timestamp gap: re-anchor on this frame
+                    if pending_start is not None:
+                        scan(pending, pending_start)
+                    pending = np.empty(0, dtype=np.float32)
+                    pending_start = timestamp
+            elif pending_start is None:
+                pending_start = 0.0
+            # Loudest channel per sample, so a window is silent only when
+            # every channel is, as with silencedetect
+            peaks = np.max(np.abs(resampled.to_ndarray()), axis=0)
+            pending = np.concatenate((pending, peaks))
+
+        with av.open(video_path) as container:
+            stream = container.streams.audio[0]
+            stream.thread_type = 'AUTO'
+            start_offset = (container.start_time or 0) / av.time_base
+            # Planar and in the source layout; a downmix would lower
+            # one-sided audio under the threshold
+            resampler = av.AudioResampler(format='fltp', rate=_ANALYSIS_SAMPLE_RATE)
+
+            for packet in container.demux(stream):
+                if self.cancelled:
+                    return []
+                for frame in packet.decode():
+                    for resampled in resampler.resample(frame):
+                        feed(resampled)
+                if len(pending) >= window:
+                    usable = scan(pending, pending_start)
+                    pending_start += usable / _ANALYSIS_SAMPLE_RATE
+                    pending = pending[usable:]
+
+            for resampled in resampler.resample(None):
+                feed(resampled)
+            if pending_start is not None:
+                scan(pending, pending_start)
+
+        # Silence running to the end of the file
+        if silence_start is not None and scanned_end - silence_start >= min_duration:
+            silence_segments.append((silence_start, scanned_end))
+
+        return silence_segments
+
     def get_video_info(self, video_path: str) -> dict:
-        """Get video metadata using ffprobe"""
+        """Get video metadata using ffprobe, cached per path"""
+        info = self._probe_cache.get(video_path)
+        if info is None:
+            info = self._probe_uncached(video_path)
+            if info:
+                self._probe_cache[video_path] = info
+        return info
+
+    def _probe_uncached(self, video_path: str) -> dict:
+        """Probe metadata with PyAV, falling back to ffprobe"""
+        if av is not None:
+            try:
+                return self._probe_av(video_path)
+            except Exception:
+                pass
+        return self._probe_ffprobe(video_path)
+
+    @staticmethod
+    def _probe_av(video_path: str) -> dict:
+        """Read container metadata with PyAV in ffprobe's JSON layout"""
+        with av.open(video_path) as container:
+            info = {
+                'format': {
+                    'filename': video_path,
+                    'format_name': container.format.name,
+                    'nb_streams': len(container.streams)
+                },
+                'streams': []
+            }
+            if container.duration is not None:
+                info['format']['duration'] = str(container.duration / av.time_base)
+            if container.bit_rate:
+                info['format']['bit_rate'] = str(container.bit_rate)
+
+            for stream in container.streams:
+                entry = {
+                    'index': stream.index,
+                    'codec_type': stream.type,
+                    'codec_name': stream.codec_context.name
+                }
+                if stream.type == 'video':
+                    entry['width'] = stream.codec_context.width
+                    entry['height'] = stream.codec_context.height
+                elif stream.type == 'audio':
+                    entry['sample_rate'] = str(stream.codec_context.sample_rate)
+                    entry['channels'] = stream.codec_context.layout.nb_channels
+                if stream.duration is not None and stream.time_base is not None:
+                    entry['duration'] = str(float(stream.duration * stream.time_base))
+                info['streams'].append(entry)
+
+        return info
+
+    def _probe_ffprobe(self, video_path: str) -> dict:
+        """Run ffprobe and return its parsed JSON output"""
         cmd = [
             self.ffprobe_path,
             '-v', 'quiet',
@@ -94,7 +431,13 @@ class FFmpegHandler:
         ]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=30
+            )
             if result.returncode == 0:
                 return json.loads(result.stdout)
             return {}
@@ -107,7 +450,8 @@ class FFmpegHandler:
         keep_segments: List[Tuple[float, float]],
         output_path: str,
         padding: float = 0.5,
-        progress_callback: Optional[Callable[[str], None]] = None
+        progress_callback: Optional[Callable[[str], None]] = None,
+        frame_exact: bool = False
     ) -> bool:
         """
         Cut video keeping only specified segments
@@ -118,6 +462,8 @@ class FFmpegHandler:
             output_path: Output file path
             padding: Seconds to keep before/after each segment
             progress_callback: Optional callback for progress updates
+            frame_exact: Re-encode through a trim/concat filter graph for
+                frame-exact cuts instead of stream-copying each segment
 
         Returns:
             True if successful
@@ -130,7 +476,66 @@ class FFmpegHandler:
         if progress_callback:
             progress_callback(f"Creating video with {len(keep_segments)} segments...")
 
-        # Build filter complex for cutting
+        if not frame_exact:
+            return self._cut_video_copy(
+                video_path,
+                keep_segments,
+                output_path,
+                padding,
+                progress_callback
+            )
+
+        if len(keep_segments) == 1:
+            start, end = keep_segments[0]
+            padded_start = max(0, start - padding)
+            padded_end = end + padding
+            chunks = self.threads // 2
+            if self._choose_encoder()[0] != 'libx264':
+                chunks = min(chunks, _MAX_HW_ENCODE_SESSIONS)
+            if padded_end - padded_start >= _PARALLEL_ENCODE_MIN_DURATION and chunks >= 2:
+                boundaries = self._chunk_boundaries(video_path, padded_start, padded_end, chunks)
+                if len(boundaries) > 2:
+                    if self._encode_parallel(
+                        video_path,
+                        boundaries,
+                        output_path,
+                        progress_callback
+                    ):
+                        return True
+                    if self.cancelled:
+                        return False
+                    # A rejected encoder session or bad chunk fails the
+                    # whole split; retry as one encode
+                    if progress_callback:
+                        progress_callback("Parallel encode failed, retrying as a single encode...")
+
+        filter_complex = self._build_cut_filter(keep_segments, padding)
+        output_args = [
+            '-map', '[outv]',
+            '-map', '[outa]',
+            *self._video_encoder_args(),
+            '-c:a', 'aac',
+            '-b:a', '192k',
+            '-y',
+            output_path
+        ]
+
+        with self._encode_session():
+            return self._run_filter_graph(
+                video_path,
+                filter_complex,
+                output_args,
+                output_path,
+                progress_callback
+            )
+
+    @staticmethod
+    def _build_cut_filter(
+        keep_segments: List[Tuple[float, float]],
+        padding: float
+    ) -> str:
+        """Build a trim/concat filter graph producing [outv] and [outa]"""
+        count = len(keep_segments)
         filter_parts = []
         for i, (start, end) in enumerate(keep_segments):
             # Apply padding
@@ -139,50 +544,92 @@ class FFmpegHandler:
 
             filter_parts.append(
                 f"[0:v]trim=start={padded_start}:end={padded_end},setpts=PTS-STARTPTS[v{i}];"
-                f"[0:a]atrim=start={padded_start}:end={padded_end},asetpts=PTS-STARTPTS[a{i}]"
+                f"[0:a]atrim=start={padded_start}:end={padded_end},asetpts=PTS-STARTPTS[a{i}];"
             )
 
         # Concatenate all segments
-        v_inputs = ''.join([f"[v{i}]" for i in range(len(keep_segments))])
-        a_inputs = ''.join([f"[a{i}]" for i in range(len(keep_segments))])
-        filter_complex = ';'.join(filter_parts)
-        filter_complex += f";{v_inputs}concat=n={len(keep_segments)}:v=1:a=0[outv];"
-        filter_complex += f"{a_inputs}concat=n={len(keep_segments)}:v=0:a=1[outa]"
+        filter_parts.extend(f"[v{i}]" for i in range(count))
+        filter_parts.append(f"concat=n={count}:v=1:a=0[outv];")
+        filter_parts.extend(f"[a{i}]" for i in range(count))
+        filter_parts.append(f"concat=n={count}:v=0:a=1[outa]")
+        return ''.join(filter_parts)
 
-        cmd = [
-            self.ffmpeg_path,
-            '-i', video_path,
-            '-filter_complex', filter_complex,
-            '-map', '[outv]',
-            '-map', '[outa]',
-            '-c:v', 'libx264',
-            '-crf', '23',
-            '-preset', 'medium',
-            '-c:a', 'aac',
-            '-b:a', '192k',
-            '-y',
-            output_path
-        ]
+    def _run_filter_graph(
+        self,
+        video_path: str,
+        filter_complex: str,
+        output_args: List[str],
+        output_path: str,
+        progress_callback: Optional[Callable[[str], None]] = None
+    ) -> bool:
+        """Run a filter graph encode, monitoring progress"""
+        script_path = None
 
         try:
+            # Large graphs can exceed the OS argv limit, so hand them to FFmpeg
+            # through a script file instead
+            if len(filter_complex) > _FILTER_SCRIPT_THRESHOLD:
+                script_path = Path(output_path).with_suffix('.filtergraph.txt')
+                script_path.write_text(filter_complex, encoding='utf-8')
+                filter_args = ['-filter_complex_script', str(script_path)]
+            else:
+                filter_args = ['-filter_complex', filter_complex]
+
+            # Machine-readable progress goes to stdout; the human-readable
+            # stats on stderr are not needed
+            cmd = [
+                self.ffmpeg_path,
+                '-nostats',
+                '-progress', 'pipe:1',
+                '-i', video_path,
+                *filter_args,
+                *output_args
+            ]
+
             # Run ffmpeg with progress monitoring
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
                 universal_newlines=True
             )
 
-            # Monitor progress
-            for line in process.stderr:
-                if progress_callback and 'time=' in line:
-                    time_match = re.search(r'time=(\d{2}):(\d{2}):(\d{2})', line)
-                    if time_match:
-                        h, m, s = map(int, time_match.groups())
-                        current_time = h * 3600 + m * 60 + s
-                        progress_callback(f"Processing... {current_time}s")
+            # Drain stdout on a separate thread so a slow callback never
+            # stalls FFmpeg on a full pipe
+            lines: queue.Queue = queue.Queue(maxsize=_PROGRESS_QUEUE_SIZE)
+            reader = threading.Thread(
+                target=self._pump_lines,
+                args=(process.stdout, lines),
+                daemon=True
+            )
+            reader.start()
+
+            # Progress arrives as key=value blocks, each ending with a
+            # progress= line; report at most every _PROGRESS_INTERVAL
+            progress = {}
+            last_report = 0.0
+            while True:
+                line = lines.get()
+                if line is None:
+                    break
 
+                key, _, value = line.strip().partition('=')
+                if key != 'progress':
+                    progress[key] = value
+                    continue
+
+                now = time.monotonic()
+                if progress_callback and now - last_report >= _PROGRESS_INTERVAL:
+                    # out_time_ms is reported in microseconds despite its name
+                    try:
+                        current_time = int(progress.get('out_time_ms', '')) // 1_000_000
+                    except ValueError:
+                        continue
+                    progress_callback(f"Processing... {current_time}s")
+                    last_report = now
+
+            reader.join()
             process.wait()
 
             if process.returncode == 0:
@@ -199,6 +646,274 @@ class FFmpegHandler:
                 progress_callback(f"Error cutting video: {str(e)}")
             return False
 
+        finally:
+            if script_path is not None:
+                script_path.unlink(missing_ok=True)
+
+    def _chunk_boundaries(
+        self,
+        video_path: str,
+        start: float,
+        end: float,
+        chunks: int
+    ) -> List[float]:
+        """Split [start, end] into roughly equal chunks snapped to keyframes"""
+        cmd = [
+            self.ffprobe_path,
+            '-v', 'error',
+            '-select_streams', 'v:0',
+            '-read_intervals', f'{start}%{end}',
+            '-show_entries', 'packet=pts_time,flags',
+            '-of', 'csv=p=0',
+            video_path
+        ]
+
+        try:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=None
+            )
+            if result.returncode != 0:
+                return []
+        except Exception:
+            return []
+
+        keyframes = []
+        for line in result.stdout.splitlines():
+            pts_time, _, flags = line.partition(',')
+            if 'K' in flags:
+                try:
+                    keyframes.append(float(pts_time))
+                except ValueError:
+                    continue
+        keyframes = sorted(t for t in keyframes if start < t < end)
+        if not keyframes:
+            return []
+
+        # Snap each ideal split point to the nearest keyframe
+        boundaries = [start]
+        step = (end - start) / chunks
+        for k in range(1, chunks):
+            target = start + k * step
+            nearest = min(keyframes, key=lambda t: abs(t - target))
+            if nearest > boundaries[-1]:
+                boundaries.append(nearest)
+        boundaries.append(end)
+
+        return boundaries
+
+    def _encode_parallel(
+        self,
+        video_path: str,
+        boundaries: List[float],
+        output_path: str,
+        progress_callback: Optional[Callable[[str], None]] = None
+    ) -> bool:
+        """Encode keyframe-aligned chunks concurrently and concat them"""
+        chunks = len(boundaries) - 1
+        threads = max(1, self.threads // chunks)
+
+        if progress_callback:
+            progress_callback(f"Encoding in {chunks} parallel chunks...")
+
+        output_dir = Path(output_path).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.TemporaryDirectory(dir=output_dir) as temp_dir:
+            chunk_paths = [
+                str(Path(temp_dir) / f"chunk_{i:03d}.mp4") for i in range(chunks)
+            ]
+
+            try:
+                with ThreadPoolExecutor(max_workers=chunks) as executor:
+                    futures = [
+                        executor.submit(
+                            self._encode_clip,
+                            video_path,
+                            chunk_paths[i],
+                            boundaries[i],
+                            boundaries[i + 1] - boundaries[i],
+                            threads,
+                            True
+                        )
+                        for i in range(chunks)
+                    ]
+                    for done, future in enumerate(as_completed(futures), 1):
+                        future.result()
+                        if progress_callback:
+                            progress_callback(f"Encoded chunk {done}/{chunks}")
+
+            except Exception as e:
+                if progress_callback:
+                    progress_callback(f"Error cutting video: {str(e)}")
+                return False
+
+            if not self.merge_clips(chunk_paths, output_path, progress_callback):
+                return False
+
+        if progress_callback:
+            progress_callback("Video created successfully!")
+        return True
+
+    @staticmethod
+    def _pump_lines(stream, lines: queue.Queue):
+        """Copy lines from a pipe into a queue, dropping them when it is full"""
+        for line in stream:
+            try:
+                lines.put_nowait(line)
+            except queue.Full:
+                pass
+        lines.put(None)
+
+    def _cut_video_copy(
+        self,
+        video_path: str,
+        keep_segments: List[Tuple[float, float]],
+        output_path: str,
+        padding: float,
+        progress_callback: Optional[Callable[[str], None]] = None
+    ) -> bool:
+        """Cut video by stream-copying each segment and concat-demuxing them"""
+        output_dir = Path(output_path).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.TemporaryDirectory(dir=output_dir) as temp_dir:
+            clip_paths = self.export_clips(
+                video_path,
+                keep_segments,
+                temp_dir,
+                Path(output_path).stem,
+                padding,
+                lambda msg, cur, total: progress_callback(msg) if progress_callback else None,
+                reencode=False
+            )
+
+            if len(clip_paths) != len(keep_segments):
+                if progress_callback:
+                    progress_callback(
+                        f"Error: Only {len(clip_paths)} of {len(keep_segments)} segments were cut"
+                    )
+                return False
+
+            if not self.merge_clips(clip_paths, output_path, progress_callback):
+                return False
+
+        if progress_callback:
+            progress_callback("Video created successfully!")
+        return True
+
+    def cut_video_and_clips(
+        self,
+        video_path: str,
+        keep_segments: List[Tuple[float, float]],
+        output_path: str,
+        clips_dir: str,
+        base_name: str,
+        padding: float = 0.5,
+        progress_callback: Optional[Callable[[str], None]] = None,
+        frame_exact: bool = False
+    ) -> List[str]:
+        """
+        Create the merged video and individual clips from a single pass
+
+        Without frame_exact the clips are stream-copied once and then
+        concatenated into the merged video. With frame_exact the trimmed
+        segments are encoded once and the tee muxer writes both the merged
+        file and a segment muxer split at each clip boundary.
+
+        Args:
+            video_path: Input video path
+            keep_segments: List of (start, end) tuples to keep
+            output_path: Merged output file path
+            clips_dir: Output directory for clips
+            base_name: Base name for clip files
+            padding: Seconds to keep before/after each segment
+            progress_callback: Optional callback for progress updates
+            frame_exact: Re-encode for frame-exact cuts
+
+        Returns:
+            List of created file paths, merged video first
+        """
+        if not keep_segments:
+            if progress_callback:
+                progress_callback("No segments to keep")
+            return []
+
+        Path(clips_dir).mkdir(parents=True, exist_ok=True)
+
+        if not frame_exact:
+            clip_files = self.export_clips(
+                video_path,
+                keep_segments,
+                clips_dir,
+                base_name,
+                padding,
+                lambda msg, cur, total: progress_callback(msg) if progress_callback else None,
+                reencode=False
+            )
+            if len(clip_files) == len(keep_segments) and self.merge_clips(
+                clip_files,
+                output_path,
+                progress_callback
+            ):
+                return [output_path] + clip_files
+            return clip_files
+
+        if progress_callback:
+            progress_callback(f"Creating video and {len(keep_segments)} clips...")
+
+        # Clip boundaries on the edited timeline
+        boundaries = []
+        elapsed = 0.0
+        for start, end in keep_segments[:-1]:
+            padded_start = max(0, start - padding)
+            elapsed += (end + padding) - padded_start
+            boundaries.append(f"{elapsed:.3f}")
+        segment_times = ','.join(boundaries)
+
+        # tee treats backslashes as escapes, so pass POSIX-style paths
+        clip_pattern = (Path(clips_dir) / f"{base_name}_clip_%03d.mp4").as_posix()
+        segment_opts = 'f=segment:segment_start_number=1:reset_timestamps=1'
+        if segment_times:
+            segment_opts += f':segment_times={segment_times}'
+        tee_outputs = f"{Path(output_path).as_posix()}|[{segment_opts}]{clip_pattern}"
+
+        output_args = [
+            '-map', '[outv]',
+            '-map', '[outa]',
+            *self._video_encoder_args(),
+            '-c:a', 'aac',
+            '-b:a', '192k'
+        ]
+        if segment_times:
+            # Keyframes at every clip boundary so the segment muxer can split
+            output_args += ['-force_key_frames', segment_times]
+            # NVENC only makes forced keyframes IDR frames when asked; the
+            # segment muxer needs IDRs to start each clip decodable
+            if self._choose_encoder()[0] == 'h264_nvenc':
+                output_args += ['-forced-idr', '1']
+        output_args += ['-f', 'tee', '-y', tee_outputs]
+
+        with self._encode_session():
+            encoded = self._run_filter_graph(
+                video_path,
+                self._build_cut_filter(keep_segments, padding),
+                output_args,
+                output_path,
+                progress_callback
+            )
+        if not encoded:
+            return []
+
+        clip_files = [
+            str(Path(clips_dir) / f"{base_name}_clip_{i:03d}.mp4")
+            for i in range(1, len(keep_segments) + 1)
+        ]
+        return [output_path] + [clip for clip in clip_files if Path(clip).exists()]
+
     def export_clips(
         self,
         video_path: str,
@@ -206,7 +921,8 @@ class FFmpegHandler:
         output_dir: str,
         base_name: str,
         padding: float = 0.5,
-        progress_callback: Optional[Callable[[str, int, int], None]] = None
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        reencode: bool = False
     ) -> List[str]:
         """
         Export individual clips
@@ -218,45 +934,124 @@ class FFmpegHandler:
             base_name: Base name for output files
             padding: Padding in seconds
             progress_callback: Optional callback(message, current, total)
+            reencode: Re-encode for frame-exact cuts instead of copying
+                streams (stream copy starts each clip on the nearest
+                preceding keyframe)
 
         Returns:
             List of created file paths
         """
-        output_files = []
+        if not segments:
+            return []
+
         Path(output_dir).mkdir(parents=True, exist_ok=True)
+        total = len(segments)
 
-        for i, (start, end) in enumerate(segments, 1):
-            padded_start = max(0, start - padding)
-            duration = (end + padding) - padded_start
+        # Clips are independent, so run several encodes at once and split the
+        # cores between them
+        max_workers = max(1, min(total, self.threads // _THREADS_PER_CLIP))
+        if reencode and self._choose_encoder()[0] != 'libx264':
+            max_workers = min(max_workers, _MAX_HW_ENCODE_SESSIONS)
+        threads = max(1, self.threads // max_workers)
 
-            output_file = str(Path(output_dir) / f"{base_name}_clip_{i:03d}.mp4")
+        created = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for i, (start, end) in enumerate(segments, 1):
+                padded_start = max(0, start - padding)
+                duration = (end + padding) - padded_start
+                output_file = str(Path(output_dir) / f"{base_name}_clip_{i:03d}.mp4")
 
-            cmd = [
-                self.ffmpeg_path,
-                '-ss', str(padded_start),
-                '-i', video_path,
-                '-t', str(duration),
-                '-c:v', 'libx264',
-                '-crf', '23',
-                '-preset', 'medium',
-                '-c:a', 'aac',
-                '-b:a', '192k',
-                '-y',
-                output_file
-            ]
+                future = executor.submit(
+                    self._encode_clip,
+                    video_path,
+                    output_file,
+                    padded_start,
+                    duration,
+                    threads,
+                    reencode
+                )
+                futures[future] = (i, output_file)
 
-            try:
-                if progress_callback:
-                    progress_callback(f"Exporting clip {i}/{len(segments)}", i, len(segments))
+            for done, future in enumerate(as_completed(futures), 1):
+                i, output_file = futures[future]
+                try:
+                    future.result()
+                    created[i] = output_file
+                    if progress_callback:
+                        progress_callback(f"Exported clip {done}/{total}", done, total)
 
-                subprocess.run(cmd, capture_output=True, timeout=None, check=True)
-                output_files.append(output_file)
+                except Exception as e:
+                    if progress_callback:
+                        progress_callback(f"Error exporting clip {i}: {str(e)}", done, total)
 
-            except Exception as e:
-                if progress_callback:
-                    progress_callback(f"Error exporting clip {i}: {str(e)}", i, len(segments))
+        # Keep clips in timeline order regardless of completion order
+        return [created[i] for i in sorted(created)]
+
+    def _encode_clip(
+        self,
+        video_path: str,
+        output_file: str,
+        start: float,
+        duration: float,
+        threads: int,
+        reencode: bool = False
+    ) -> str:
+        """Export a single clip, raising CalledProcessError on failure
+
+        A re-encode that fails on a hardware encoder, e.g. because the GPU
+        rejected the session, is retried once with libx264.
+        """
+        if not reencode:
+            # Copy the bitstream as-is; no decode or encode at all
+            self._run_clip(video_path, output_file, start, duration, [
+                '-c', 'copy',
+                '-avoid_negative_ts', 'make_zero'
+            ])
+            return output_file
+
+        audio_args = ['-c:a', 'aac', '-b:a', '192k', '-threads', str(threads)]
+        try:
+            with self._encode_session():
+                self._run_clip(video_path, output_file, start, duration, [
+                    *self._video_encoder_args(),
+                    *audio_args
+                ])
+        except subprocess.CalledProcessError:
+            if self._choose_encoder()[0] == 'libx264' or self.cancelled:
+                raise
+            self._run_clip(video_path, output_file, start, duration, [
+                *self._video_encoder_args(software=True),
+                *audio_args
+            ])
+        return output_file
+
+    def _run_clip(
+        self,
+        video_path: str,
+        output_file: str,
+        start: float,
+        duration: float,
+        codec_args: List[str]
+    ) -> None:
+        """Run one clip export, raising CalledProcessError on failure"""
+        cmd = [
+            self.ffmpeg_path,
+            '-ss', str(start),
+            '-i', video_path,
+            '-t', str(duration),
+            *codec_args,
+            '-y', output_file
+        ]
 
-        return output_files
+        # stderr is kept so failures carry FFmpeg's error output
+        subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=None,
+            check=True
+        )
 
     def merge_clips(
         self,
@@ -268,17 +1063,31 @@ class FFmpegHandler:
         if not clip_paths:
             return False
 
-        # Create concat file
-        concat_file = Path(output_path).parent / "concat_list.txt"
-        with open(concat_file, 'w') as f:
-            for clip in clip_paths:
-                f.write(f"file '{Path(clip).absolute()}'\n")
+        if len(clip_paths) == 1:
+            # Nothing to join; a plain copy avoids spawning FFmpeg
+            try:
+                shutil.copyfile(clip_paths[0], output_path)
+                return True
+            except Exception as e:
+                if progress_callback:
+                    progress_callback(f"Error merging clips: {str(e)}")
+                return False
+
+        # Feed the concat list on stdin instead of writing a list file
+        lines = []
+        for clip in clip_paths:
+            # Single quotes inside concat list entries are written as '\''.
+            # The file: prefix stops paths resolving relative to pipe:
+            escaped = str(Path(clip).absolute()).replace("'", "'\\''")
+            lines.append(f"file 'file:{escaped}'\n")
+        concat_list = ''.join(lines)
 
         cmd = [
             self.ffmpeg_path,
             '-f', 'concat',
             '-safe', '0',
-            '-i', str(concat_file),
+            '-protocol_whitelist', 'file,pipe',
+            '-i', 'pipe:0',
             '-c', 'copy',
             '-y',
             output_path
@@ -288,10 +1097,14 @@ class FFmpegHandler:
             if progress_callback:
                 progress_callback("Merging clips...")
 
-            subprocess.run(cmd, capture_output=True, timeout=None, check=True)
-
-            # Clean up concat file
-            concat_file.unlink()
+            subprocess.run(
+                cmd,
+                input=concat_list.encode('utf-8'),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=None,
+                check=True
+            )
 
             if progress_callback:
                 progress_callback("Clips merged successfully!")
@@ -307,16 +1120,23 @@ class FFmpegHandler:
         self,
         video_path: str,
         output_path: str,
-        progress_callback: Optional[Callable[[str], None]] = None
+        progress_callback: Optional[Callable[[str], None]] = None,
+        sample_rate: int = 16000,
+        channels: int = 1
     ) -> bool:
-        """Extract audio from video for Whisper processing"""
+        """Extract audio from video for Whisper processing
+
+        Defaults to the 16 kHz mono PCM Whisper decodes, so the WAV is as
+        small as possible and needs no resampling when loaded.
+        """
         cmd = [
             self.ffmpeg_path,
             '-i', video_path,
             '-vn',
             '-acodec', 'pcm_s16le',
-            '-ar', '16000',
-            '-ac', '1',
+            '-ar', str(sample_rate),
+            '-ac', str(channels),
+            '-f', 'wav',
             '-y',
             output_path
         ]
@@ -325,10 +1145,83 @@ class FFmpegHandler:
             if progress_callback:
                 progress_callback("Extracting audio...")
 
-            subprocess.run(cmd, capture_output=True, timeout=None, check=True)
+            subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=None,
+                check=True
+            )
             return True
 
         except Exception as e:
             if progress_callback:
                 progress_callback(f"Error extracting audio: {str(e)}")
             return False
+
+    def read_audio(
+        self,
+        video_path: str,
+        progress_callback: Optional[Callable[[str], None]] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Decode a video's audio track straight into memory for Whisper
+
+        FFmpeg writes 16 kHz mono PCM to a pipe, so no WAV file is written
+        to disk and read back.
+
+        Args:
+            video_path: Path to video file
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            Float32 samples in [-1, 1), or None if error
+        """
+        cmd = [
+            self.ffmpeg_path,
+            '-nostdin',
+            '-hide_banner',
+            '-loglevel', 'error',
+            '-i', video_path,
+            '-vn', '-sn', '-dn',
+            '-f', 's16le',
+            '-acodec', 'pcm_s16le',
+            '-ar', '16000',
+            '-ac', '1',
+            '-'
+        ]
+
+        process = None
+        try:
+            if progress_callback:
+                progress_callback("Extracting audio...")
+
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+            self._processes.add(process)
+
+            pcm = bytearray()
+            chunk_bytes = _PCM_CHUNK_SAMPLES * 2
+            while True:
+                chunk = process.stdout.read(chunk_bytes)
+                if not chunk:
+                    break
+                pcm += chunk
+
+            if process.wait() != 0 or self.cancelled:
+                raise RuntimeError(f"FFmpeg exited with code {process.returncode}")
+
+            # Drop a trailing odd byte if the pipe was cut mid-sample
+            samples = np.frombuffer(pcm, dtype=np.int16, count=len(pcm) // 2)
+            return samples.astype(np.float32) / 32768.0
+
+        except Exception as e:
+            if progress_callback:
+                progress_callback(f"Error extracting audio: {str(e)}")
+            return None
+
+        finally:
+            self._processes.discard(process)
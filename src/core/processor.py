@@ -1,10 +1,15 @@
 """Main video processor combining FFmpeg and Whisper"""
 
 import csv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple, Optional, Callable, Dict
+
+import numpy as np
+
 from .ffmpeg_handler import FFmpegHandler
 from .whisper_handler import WhisperHandler
+from ..utils.file_utils import format_duration
 
 
 class VideoProcessor:
@@ -12,13 +17,34 @@ class VideoProcessor:
 
     def __init__(self, config: Dict):
         self.config = config
-        self.ffmpeg = FFmpegHandler(config.get('ffmpeg_path', 'ffmpeg'))
-        self.whisper = WhisperHandler(config.get('whisper_model', 'base'))
+        self.ffmpeg = FFmpegHandler(
+            config.get('ffmpeg_path', 'ffmpeg'),
+            config.get('encoder_preset', 'veryfast'),
+            config.get('hardware_encoding', True),
+            config.get('ffmpeg_threads', 0)
+        )
+        self.whisper = WhisperHandler.get(
+            config.get('whisper_model', 'base'),
+            config.get('whisper_compute_type', 'auto'),
+            batch_size=config.get('whisper_batch_size', 8),
+            use_compile=config.get('whisper_compile', False)
+        )
         self.cancelled = False
 
     def cancel(self):
         """Cancel current processing"""
         self.cancelled = True
+        self.ffmpeg.cancel()
+
+    def reset(self):
+        """Clear a previous cancel before starting a new batch
+
+        Called once per batch rather than per video, since workers share
+        this processor and a per-video reset would undo a cancel issued
+        while other videos are in flight.
+        """
+        self.cancelled = False
+        self.ffmpeg.cancelled = False
 
     def process_video(
         self,
@@ -37,7 +63,6 @@ class VideoProcessor:
         Returns:
             Dict with processing results
         """
-        self.cancelled = False
         results = {
             'success': False,
             'input_file': video_path,
@@ -62,7 +87,8 @@ class VideoProcessor:
             keep_segments = self._detect_keep_segments(
                 video_path,
                 mode,
-                progress_callback
+                progress_callback,
+                results['original_duration']
             )
 
             if self.cancelled:
@@ -76,7 +102,8 @@ class VideoProcessor:
                 return results
 
             # Calculate statistics
-            final_duration = sum(end - start for start, end in keep_segments)
+            kept = np.asarray(keep_segments, dtype=np.float64).reshape(-1, 2)
+            final_duration = float((kept[:, 1] - kept[:, 0]).sum())
             results['final_duration'] = final_duration
             results['time_saved'] = results['original_duration'] - final_duration
             results['segments_removed'] = self._count_removed_segments(
@@ -90,33 +117,58 @@ class VideoProcessor:
             output_dir_path.mkdir(parents=True, exist_ok=True)
 
             # Export based on configuration
-            if self.config.get('export_merged', True):
-                merged_output = str(output_dir_path / f"{base_name}_edited.mp4")
-                if self.ffmpeg.cut_video(
+            export_merged = self.config.get('export_merged', True)
+            export_clips = self.config.get('export_clips', False)
+            frame_exact = self.config.get('frame_exact_cuts', False)
+            reencode_clips = self.config.get('reencode_clips', False)
+            merged_output = str(output_dir_path / f"{base_name}_edited.mp4")
+            clips_dir = str(output_dir_path / f"{base_name}_clips")
+
+            if export_merged and export_clips and (frame_exact or not reencode_clips):
+                # Both outputs come from the same cuts, so produce them together
+                results['output_files'].extend(self.ffmpeg.cut_video_and_clips(
                     video_path,
                     keep_segments,
                     merged_output,
+                    clips_dir,
+                    base_name,
                     self.config.get('padding_seconds', 0.5),
-                    progress_callback
-                ):
-                    results['output_files'].append(merged_output)
+                    progress_callback,
+                    frame_exact
+                ))
+
+            else:
+                if export_merged:
+                    if self.ffmpeg.cut_video(
+                        video_path,
+                        keep_segments,
+                        merged_output,
+                        self.config.get('padding_seconds', 0.5),
+                        progress_callback,
+                        frame_exact
+                    ):
+                        results['output_files'].append(merged_output)
+
+                if self.cancelled:
+                    results['error'] = "Processing cancelled by user"
+                    return results
+
+                if export_clips:
+                    clip_files = self.ffmpeg.export_clips(
+                        video_path,
+                        keep_segments,
+                        clips_dir,
+                        base_name,
+                        self.config.get('padding_seconds', 0.5),
+                        lambda msg, cur, total: progress_callback(msg) if progress_callback else None,
+                        reencode_clips
+                    )
+                    results['output_files'].extend(clip_files)
 
             if self.cancelled:
                 results['error'] = "Processing cancelled by user"
                 return results
 
-            if self.config.get('export_clips', False):
-                clips_dir = str(output_dir_path / f"{base_name}_clips")
-                clip_files = self.ffmpeg.export_clips(
-                    video_path,
-                    keep_segments,
-                    clips_dir,
-                    base_name,
-                    self.config.get('padding_seconds', 0.5),
-                    lambda msg, cur, total: progress_callback(msg) if progress_callback else None
-                )
-                results['output_files'].extend(clip_files)
-
             if self.config.get('export_timestamps', True):
                 timestamp_file = str(output_dir_path / f"{base_name}_timestamps.csv")
                 if self.generate_timestamp_report(
@@ -151,7 +203,8 @@ class VideoProcessor:
         self,
         video_path: str,
         mode: str,
-        progress_callback: Optional[Callable[[str], None]] = None
+        progress_callback: Optional[Callable[[str], None]] = None,
+        duration: Optional[float] = None
     ) -> List[Tuple[float, float]]:
         """Detect segments to keep based on processing mode"""
 
@@ -163,7 +216,9 @@ class VideoProcessor:
                 self.config.get('min_silence_duration', 2.0),
                 progress_callback
             )
-            return self._invert_segments(silence_segments, self._get_duration(video_path))
+            if not duration:
+                duration = self._get_duration(video_path)
+            return self._invert_segments(silence_segments, duration)
 
         elif mode == 'whisper':
             # Whisper speech detection only
@@ -179,19 +234,25 @@ class VideoProcessor:
             if progress_callback:
                 progress_callback("Using hybrid mode (FFmpeg + Whisper)")
 
-            silence_segments = self.ffmpeg.detect_silence(
-                video_path,
-                self.config.get('silence_threshold_db', -30),
-                self.config.get('min_silence_duration', 2.0),
-                progress_callback
-            )
-
-            speech_segments = self.whisper.detect_speech_from_video(
-                video_path,
-                self.ffmpeg,
-                self.config.get('min_silence_duration', 2.0),
-                progress_callback
-            )
+            # Both detectors read the same file independently, so run them
+            # side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                silence_future = executor.submit(
+                    self.ffmpeg.detect_silence,
+                    video_path,
+                    self.config.get('silence_threshold_db', -30),
+                    self.config.get('min_silence_duration', 2.0),
+                    progress_callback
+                )
+                speech_future = executor.submit(
+                    self.whisper.detect_speech_from_video,
+                    video_path,
+                    self.ffmpeg,
+                    self.config.get('min_silence_duration', 2.0),
+                    progress_callback
+                )
+                silence_segments = silence_future.result()
+                speech_segments = speech_future.result()
 
             # Keep segments that have speech (from Whisper)
             # but also weren't detected as silence (from FFmpeg)
@@ -207,6 +268,17 @@ class VideoProcessor:
             return float(info['format'].get('duration', 0))
         return 0
 
+    @staticmethod
+    def _to_array(segments: List[Tuple[float, float]]) -> np.ndarray:
+        """Convert segments to an (N, 2) array sorted by start, then end"""
+        arr = np.asarray(segments, dtype=np.float64).reshape(-1, 2)
+        return arr[np.lexsort((arr[:, 1], arr[:, 0]))]
+
+    @staticmethod
+    def _to_segments(arr: np.ndarray) -> List[Tuple[float, float]]:
+        """Convert an (N, 2) array back to a list of (start, end) tuples"""
+        return [tuple(row) for row in arr.tolist()]
+
     def _invert_segments(
         self,
         silence_segments: List[Tuple[float, float]],
@@ -216,19 +288,15 @@ class VideoProcessor:
         if not silence_segments:
             return [(0, total_duration)]
 
-        keep_segments = []
-        last_end = 0
-
-        for start, end in sorted(silence_segments):
-            if start > last_end:
-                keep_segments.append((last_end, start))
-            last_end = end
+        silence = self._to_array(silence_segments)
 
-        # Add final segment if needed
-        if last_end < total_duration:
-            keep_segments.append((last_end, total_duration))
+        # Gaps run from the end of each silence to the start of the next,
+        # plus the lead-in before the first and the tail after the last
+        gap_starts = np.concatenate(([0.0], silence[:, 1]))
+        gap_ends = np.concatenate((silence[:, 0], [total_duration]))
+        mask = gap_ends > gap_starts
 
-        return keep_segments
+        return self._to_segments(np.stack((gap_starts[mask], gap_ends[mask]), axis=1))
 
     def _merge_segments(
         self,
@@ -236,21 +304,21 @@ class VideoProcessor:
         silence_segments: List[Tuple[float, float]]
     ) -> List[Tuple[float, float]]:
         """Merge speech and silence detection results"""
-        # Keep only speech segments that don't overlap with silence
-        keep_segments = []
-
-        for speech_start, speech_end in speech_segments:
-            # Check if this speech segment overlaps with silence
-            overlaps_silence = False
-            for silence_start, silence_end in silence_segments:
-                if not (speech_end < silence_start or speech_start > silence_end):
-                    overlaps_silence = True
-                    break
+        speech = self._to_array(speech_segments)
+        if not silence_segments:
+            return self._to_segments(speech)
 
-            if not overlaps_silence:
-                keep_segments.append((speech_start, speech_end))
+        # Keep only speech segments that don't overlap with silence.
+        # silencedetect never reports overlapping ranges, so silence end
+        # times are sorted too and the first silence ending at or after
+        # each speech start is found by binary search.
+        silence = self._to_array(silence_segments)
+        j = np.searchsorted(silence[:, 1], speech[:, 0], side='left')
+        in_range = j < len(silence)
+        overlaps = np.zeros(len(speech), dtype=bool)
+        overlaps[in_range] = silence[j[in_range], 0] <= speech[in_range, 1]
 
-        return keep_segments
+        return self._to_segments(speech[~overlaps])
 
     def _count_removed_segments(
         self,
@@ -326,7 +394,7 @@ class VideoProcessor:
     ) -> bool:
         """Generate XML markers for Adobe Premiere Pro"""
         try:
-            xml_content = f'''<?xml version="1.0" encoding="UTF-8"?>
+            parts = [f'''<?xml version="1.0" encoding="UTF-8"?>
 <fcpxml version="1.8">
     <resources>
         <asset id="asset1" src="file://{video_path}" hasVideo="1" hasAudio="1"/>
@@ -336,21 +404,21 @@ class VideoProcessor:
             <project name="Edited Stream">
                 <sequence>
                     <spine>
-'''
+''']
             for i, (start, end) in enumerate(segments, 1):
                 duration = end - start
-                xml_content += f'''                        <asset-clip ref="asset1" offset="{start}s" duration="{duration}s" name="Clip {i}"/>
-'''
+                parts.append(f'''                        <asset-clip ref="asset1" offset="{start}s" duration="{duration}s" name="Clip {i}"/>
+''')
 
-            xml_content += '''                    </spine>
+            parts.append('''                    </spine>
                 </sequence>
             </project>
         </event>
     </library>
 </fcpxml>
-'''
+''')
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(xml_content)
+                f.write(''.join(parts))
 
             return True
 
@@ -361,7 +429,4 @@ class VideoProcessor:
     @staticmethod
     def _format_duration(seconds: float) -> str:
         """Format seconds as HH:MM:SS"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return format_duration(seconds)
@@ -1,45 +1,207 @@
 """Whisper handler for AI-powered speech detection"""
 
+import contextlib
 import os
 from pathlib import Path
-from typing import List, Tuple, Optional, Callable, Dict
-import tempfile
+from typing import List, Tuple, Optional, Callable, Dict, Iterable, Iterator, Union
+import threading
+
+import numpy as np
+
+# Whisper models operate on 16 kHz mono audio
+_SAMPLE_RATE = 16000
+
+# Backends in order of preference when backend='auto'; whisper.cpp's SIMD
+# kernels are only preferred when there is no CUDA device
+_BACKENDS = ('faster-whisper', 'openai-whisper')
+_CPU_BACKENDS = ('whisper.cpp',) + _BACKENDS
+
+# Greedy decoding without temperature fallback; only segment boundaries
+# are used, so beam search and word timestamps are wasted decoder work
+_DECODE_OPTIONS = dict(
+    beam_size=1,
+    best_of=1,
+    temperature=0.0,
+    condition_on_previous_text=False,
+    no_speech_threshold=0.6,
+    without_timestamps=False,
+    word_timestamps=False
+)
+
+# openai-whisper pads every transcribe call to one 30 s mel window, so VAD
+# regions are packed into windows of at most this many samples
+_WINDOW_SAMPLES = 30 * _SAMPLE_RATE
+
+# whisper.cpp stores segment times in 10 ms ticks
+_WHISPER_CPP_TICKS = 100
+
 
 class WhisperHandler:
     """Handles Whisper AI speech detection"""
 
-    def __init__(self, model_name: str = "base"):
+    # Process-wide handlers keyed by (model_name, compute_type) so a loaded
+    # model is reused across videos and VideoProcessor instances
+    _INSTANCES: Dict[Tuple[str, str], 'WhisperHandler'] = {}
+    _INSTANCES_LOCK = threading.Lock()
+
+    # Import probe results shared by all handlers: requested backend ->
+    # installed backend, or None when nothing usable is installed
+    _whisper_available: Dict[str, Optional[str]] = {}
+
+    # Silero VAD as (model, get_speech_timestamps), loaded once per process;
+    # False once loading has failed. The model keeps state between chunks,
+    # so calls are serialized on _VAD_LOCK
+    _VAD: Union[None, bool, Tuple] = None
+    _VAD_LOCK = threading.Lock()
+
+    @classmethod
+    def get(
+        cls,
+        model_name: str = "base",
+        compute_type: str = "auto",
+        **kwargs
+    ) -> 'WhisperHandler':
+        """Get the shared handler for a model, creating it on first use"""
+        key = (model_name, compute_type)
+        with cls._INSTANCES_LOCK:
+            handler = cls._INSTANCES.get(key)
+            if handler is None:
+                handler = cls(model_name, compute_type, **kwargs)
+                cls._INSTANCES[key] = handler
+            return handler
+
+    @classmethod
+    def evict_others(cls, model_name: str, compute_type: str = "auto") -> None:
+        """Drop cached handlers for every other model so their weights can be freed
+
+        A handler still referenced, e.g. by a running VideoProcessor, stays
+        alive until that reference goes away.
+        """
+        key = (model_name, compute_type)
+        with cls._INSTANCES_LOCK:
+            for other in [k for k in cls._INSTANCES if k != key]:
+                del cls._INSTANCES[other]
+
+    def __init__(
+        self,
+        model_name: str = "base",
+        compute_type: str = "auto",
+        backend: str = "auto",
+        batch_size: int = 8,
+        use_compile: bool = False
+    ):
         self.model_name = model_name
+        # 'float16', 'int8', 'float32', or 'auto' (float16 on GPU, int8 on CPU)
+        self.compute_type = compute_type
+        # 'faster-whisper', 'openai-whisper', 'whisper.cpp', or 'auto'
+        # (first one installed); distil-whisper checkpoints are only
+        # published for faster-whisper
+        if backend == 'auto' and model_name.startswith('distil-'):
+            backend = 'faster-whisper'
+        self.backend = backend
+        # Audio chunks decoded together by faster-whisper; 1 disables batching
+        self.batch_size = batch_size
+        # torch.compile openai-whisper on CUDA (slow first load, faster decode)
+        self.use_compile = use_compile
         self.model = None
-        self._whisper_available = None
+        self._batched_model = None
+        self._load_lock = threading.Lock()
+        self._decode_lock = threading.Lock()
 
     def is_whisper_available(self) -> bool:
-        """Check if Whisper is installed and available"""
-        if self._whisper_available is not None:
-            return self._whisper_available
+        """Check if a Whisper backend is installed and available"""
+        if self.backend in self._whisper_available:
+            resolved = self._whisper_available[self.backend]
+            if resolved is not None:
+                self.backend = resolved
+            return resolved is not None
+
+        requested = self.backend
+        if self.backend != 'auto':
+            candidates = (self.backend,)
+        elif self._cuda_available():
+            candidates = _BACKENDS
+        else:
+            candidates = _CPU_BACKENDS
+
+        for backend in candidates:
+            try:
+                if backend == 'faster-whisper':
+                    import faster_whisper
+                elif backend == 'whisper.cpp':
+                    import pywhispercpp
+                else:
+                    import whisper
+            except ImportError:
+                continue
 
-        try:
-            import whisper
-            self._whisper_available = True
+            self._whisper_available[requested] = backend
+            self._whisper_available[backend] = backend
+            self.backend = backend
             return True
-        except ImportError:
-            self._whisper_available = False
-            return False
+
+        self._whisper_available[requested] = None
+        return False
 
     def load_model(self, progress_callback: Optional[Callable[[str], None]] = None):
         """Load Whisper model"""
         if not self.is_whisper_available():
             if progress_callback:
-                progress_callback("Whisper not installed. Install with: pip install openai-whisper")
+                progress_callback(
+                    "Whisper not installed. Install with: pip install faster-whisper"
+                )
             return False
 
-        try:
-            import whisper
+        # A background pre-warm may be loading the same model
+        with self._load_lock:
+            if self.model is not None:
+                return True
+            return self._load_model(progress_callback)
 
+    def _load_model(self, progress_callback: Optional[Callable[[str], None]] = None):
+        """Load the model for the selected backend"""
+        try:
             if progress_callback:
                 progress_callback(f"Loading Whisper {self.model_name} model...")
 
-            self.model = whisper.load_model(self.model_name)
+            self.compute_type = self._resolve_compute_type()
+
+            if self.backend == 'faster-whisper':
+                # BatchedInferencePipeline needs faster-whisper >= 1.1.0;
+                # import everything before assigning so a failure leaves
+                # the handler unloaded rather than silently unbatched
+                from faster_whisper import WhisperModel
+                if self.batch_size > 1:
+                    from faster_whisper import BatchedInferencePipeline
+
+                # CTranslate2 runs INT8/FP16 kernels natively
+                model = WhisperModel(
+                    self.model_name,
+                    device="auto",
+                    compute_type=self.compute_type
+                )
+                # Decodes several VAD chunks per forward pass
+                batched_model = (
+                    BatchedInferencePipeline(model) if self.batch_size > 1 else None
+                )
+                self.model = model
+                self._batched_model = batched_model
+            elif self.backend == 'whisper.cpp':
+                from pywhispercpp.model import Model
+
+                self.model = Model(
+                    self._ggml_model_name(),
+                    n_threads=os.cpu_count() or 1,
+                    redirect_whispercpp_logs_to=None
+                )
+            else:
+                import whisper
+
+                self.model = self._quantize_openai_model(
+                    whisper.load_model(self.model_name)
+                )
+                if self.use_compile:
+                    self._compile_openai_model(progress_callback)
 
             if progress_callback:
                 progress_callback("Whisper model loaded successfully")
@@ -51,39 +213,117 @@ class WhisperHandler:
                 progress_callback(f"Error loading Whisper model: {str(e)}")
             return False
 
+    def _ggml_model_name(self) -> str:
+        """Pick the 5-bit quantized ggml weights for the model when published"""
+        from pywhispercpp.constants import AVAILABLE_MODELS
+
+        for suffix in ('-q5_1', '-q5_0'):
+            if self.model_name + suffix in AVAILABLE_MODELS:
+                return self.model_name + suffix
+        return self.model_name
+
+    def _quantize_openai_model(self, model):
+        """Cast openai-whisper weights to FP16 on GPU or INT8 on CPU"""
+        import torch
+
+        if model.device.type == 'cuda':
+            return model.half() if self.compute_type == 'float16' else model
+
+        if self.compute_type != 'int8':
+            return model
+
+        # whisper.model.Linear only casts weights to the input dtype, which
+        # is a no-op for FP32 on CPU; swap in nn.Linear so quantize_dynamic
+        # recognizes the layers
+        for module in model.modules():
+            if isinstance(module, torch.nn.Linear):
+                module.__class__ = torch.nn.Linear
+
+        return torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+    def _compile_openai_model(self, progress_callback: Optional[Callable[[str], None]] = None):
+        """Compile the encoder/decoder with CUDA graphs and warm them up"""
+        import torch
+
+        if self.model.device.type != 'cuda':
+            return
+
+        if progress_callback:
+            progress_callback("Compiling Whisper model...")
+
+        self.model.encoder = torch.compile(
+            self.model.encoder, mode='reduce-overhead', fullgraph=True
+        )
+        # kv-cache hooks cause graph breaks in the decoder, so no fullgraph
+        self.model.decoder = torch.compile(self.model.decoder, mode='reduce-overhead')
+
+        # Run one silent 30 s window so the compile cost is paid here rather
+        # than on the first video
+        dtype = torch.float16 if self.compute_type == 'float16' else torch.float32
+        mel = torch.zeros(
+            (1, self.model.dims.n_mels, 3000), device=self.model.device, dtype=dtype
+        )
+        tokens = torch.zeros((1, 1), device=self.model.device, dtype=torch.long)
+        with torch.no_grad():
+            self.model.decoder(tokens, self.model.encoder(mel))
+
+    def _resolve_compute_type(self) -> str:
+        """Resolve 'auto' to float16 on GPU and int8 on CPU"""
+        if self.compute_type != 'auto':
+            return self.compute_type
+        return 'float16' if self._cuda_available() else 'int8'
+
+    @staticmethod
+    def _cuda_available() -> bool:
+        """Check for a CUDA device via torch or CTranslate2"""
+        try:
+            import torch
+            return torch.cuda.is_available()
+        except ImportError:
+            pass
+
+        try:
+            import ctranslate2
+            return ctranslate2.get_cuda_device_count() > 0
+        except ImportError:
+            return False
+
     def transcribe_audio(
         self,
         audio_path: str,
-        progress_callback: Optional[Callable[[str], None]] = None
+        progress_callback: Optional[Callable[[str], None]] = None,
+        min_gap: float = 2.0,
+        need_words: bool = False
     ) -> Optional[Dict]:
         """
         Transcribe audio file using Whisper
 
+        Silent stretches are skipped with Silero VAD before decoding.
+
         Args:
             audio_path: Path to audio file
             progress_callback: Optional callback for progress updates
+            min_gap: Minimum silence in seconds for VAD to split speech
+            need_words: Also align word timestamps (slower; only needed
+                for word-level exports)
 
         Returns:
             Transcription result dict or None if error
         """
-        if not self.is_whisper_available():
-            if progress_callback:
-                progress_callback("Whisper not available")
+        if not self._ensure_model(progress_callback):
             return None
 
-        if self.model is None:
-            if not self.load_model(progress_callback):
-                return None
-
         try:
             if progress_callback:
                 progress_callback("Transcribing audio with Whisper AI...")
 
-            result = self.model.transcribe(
-                audio_path,
-                verbose=False,
-                word_timestamps=True
-            )
+            with self._decode_guard():
+                result = {
+                    'segments': list(self._iter_segments(audio_path, min_gap, need_words))
+                }
+            result['text'] = ''.join(seg['text'] for seg in result['segments'])
 
             if progress_callback:
                 progress_callback("Transcription complete")
@@ -95,6 +335,202 @@ class WhisperHandler:
                 progress_callback(f"Error transcribing audio: {str(e)}")
             return None
 
+    def _ensure_model(self, progress_callback: Optional[Callable[[str], None]] = None) -> bool:
+        """Check for a backend and load the model if needed"""
+        if not self.is_whisper_available():
+            if progress_callback:
+                progress_callback("Whisper not available")
+            return False
+
+        if self.model is None:
+            return self.load_model(progress_callback)
+        return True
+
+    def _decode_guard(self):
+        """Serialize decoding on backends whose models are not thread-safe
+
+        CTranslate2 handles concurrent faster-whisper calls; openai-whisper
+        installs kv-cache hooks on the shared model and whisper.cpp reuses
+        one context, so those decode one video at a time.
+        """
+        if self.backend == 'faster-whisper':
+            return contextlib.nullcontext()
+        return self._decode_lock
+
+    def _iter_segments(
+        self,
+        audio: Union[str, np.ndarray],
+        min_gap: float,
+        need_words: bool = False
+    ) -> Iterator[Dict]:
+        """Yield transcribed segments as the backend decodes them
+
+        audio is a file path or 16 kHz mono float32 samples.
+        """
+        if self.backend == 'whisper.cpp':
+            for segment in self.model.transcribe(audio):
+                yield {
+                    'start': segment.t0 / _WHISPER_CPP_TICKS,
+                    'end': segment.t1 / _WHISPER_CPP_TICKS,
+                    # Stripped by pywhispercpp; keep the other backends' spacing
+                    'text': ' ' + segment.text
+                }
+            return
+
+        if self.backend != 'faster-whisper':
+            yield from self._iter_voiced_segments(audio, min_gap, need_words)
+            return
+
+        options = dict(
+            _DECODE_OPTIONS,
+            word_timestamps=need_words,
+            vad_filter=True,
+            vad_parameters=dict(
+                min_silence_duration_ms=int(min_gap * 1000),
+                threshold=0.5
+            )
+        )
+        if self._batched_model is not None:
+            segments, _ = self._batched_model.transcribe(
+                audio,
+                batch_size=self.batch_size,
+                **options
+            )
+        else:
+            segments, _ = self.model.transcribe(audio, **options)
+
+        # faster-whisper decodes lazily; same keys as openai-whisper segments
+        for segment in segments:
+            result = {
+                'start': segment.start,
+                'end': segment.end,
+                'text': segment.text
+            }
+            if need_words:
+                result['words'] = [
+                    {'start': word.start, 'end': word.end, 'word': word.word}
+                    for word in segment.words
+                ]
+            yield result
+
+    def _iter_voiced_segments(
+        self,
+        audio: Union[str, np.ndarray],
+        min_gap: float,
+        need_words: bool = False
+    ) -> Iterator[Dict]:
+        """Transcribe with openai-whisper, feeding it only VAD-voiced audio"""
+        # openai-whisper treats any beam_size, even 1, as beam search; None
+        # selects its GreedyDecoder
+        options = dict(
+            _DECODE_OPTIONS,
+            beam_size=None,
+            best_of=None,
+            word_timestamps=need_words,
+            verbose=False,
+            fp16=self.compute_type == 'float16'
+        )
+
+        import torch
+        import whisper
+
+        # Decode paths with openai-whisper's own FFmpeg loader; silero's
+        # read_audio would need torchaudio
+        if not isinstance(audio, np.ndarray):
+            audio = whisper.load_audio(audio, sr=_SAMPLE_RATE)
+
+        with self._VAD_LOCK:
+            vad = self._load_vad()
+            if vad is None:
+                regions = None
+            else:
+                vad_model, get_speech_timestamps = vad
+                regions = get_speech_timestamps(
+                    torch.from_numpy(audio),
+                    vad_model,
+                    threshold=0.5,
+                    sampling_rate=_SAMPLE_RATE,
+                    min_silence_duration_ms=int(min_gap * 1000)
+                )
+
+        if regions is None:
+            # VAD unavailable (e.g. offline); transcribe the whole file
+            yield from self.model.transcribe(audio, **options)['segments']
+            return
+
+        # Transcribe packed windows of voiced audio and map their timestamps
+        # back to absolute time
+        for window in self._pack_regions(regions):
+            chunk = np.concatenate([audio[r['start']:r['end']] for r in window])
+            to_absolute = self._packed_time_map(window)
+            chunk_result = self.model.transcribe(chunk, **options)
+
+            for segment in chunk_result['segments']:
+                segment['start'] = to_absolute(segment['start'], False)
+                segment['end'] = to_absolute(segment['end'], True)
+                for word in segment.get('words', []):
+                    word['start'] = to_absolute(word['start'], False)
+                    word['end'] = to_absolute(word['end'], True)
+                yield segment
+
+    @classmethod
+    def _load_vad(cls) -> Optional[Tuple]:
+        """Load Silero VAD on first use; the caller holds _VAD_LOCK
+
+        The silero-vad package is used when installed; otherwise the model
+        comes from torch.hub once and is reused for every video.
+        """
+        if cls._VAD is None:
+            try:
+                try:
+                    from silero_vad import load_silero_vad, get_speech_timestamps
+                    cls._VAD = (load_silero_vad(), get_speech_timestamps)
+                except ImportError:
+                    import torch
+
+                    vad_model, vad_utils = torch.hub.load('snakers4/silero-vad', 'silero_vad')
+                    cls._VAD = (vad_model, vad_utils[0])
+            except Exception:
+                cls._VAD = False
+        return cls._VAD or None
+
+    @staticmethod
+    def _pack_regions(regions: List[Dict]) -> Iterator[List[Dict]]:
+        """Group consecutive VAD regions into windows of at most 30 s of speech
+
+        A region longer than a window gets one to itself; openai-whisper
+        slides over it internally.
+        """
+        window, size = [], 0
+        for region in regions:
+            length = region['end'] - region['start']
+            if window and size + length > _WINDOW_SAMPLES:
+                yield window
+                window, size = [], 0
+            window.append(region)
+            size += length
+        if window:
+            yield window
+
+    @staticmethod
+    def _packed_time_map(window: List[Dict]) -> Callable[[float, bool], float]:
+        """Build a mapping from time in a packed window to absolute time
+
+        Like faster-whisper's SpeechTimestampsMap, a time exactly on the seam
+        between two regions maps to the end of the earlier region for end
+        times and the start of the later one for start times.
+        """
+        lengths = np.array([r['end'] - r['start'] for r in window], dtype=np.float64)
+        packed = np.concatenate(([0.0], np.cumsum(lengths[:-1]))) / _SAMPLE_RATE
+        origin = np.array([r['start'] for r in window], dtype=np.float64) / _SAMPLE_RATE
+
+        def to_absolute(time: float, is_end: bool) -> float:
+            index = int(np.searchsorted(packed, time, 'left' if is_end else 'right')) - 1
+            index = max(index, 0)
+            return float(origin[index] + time - packed[index])
+
+        return to_absolute
+
     def get_speech_segments(
         self,
         transcription: Dict,
@@ -113,11 +549,19 @@ class WhisperHandler:
         if not transcription or 'segments' not in transcription:
             return []
 
-        segments = []
+        # Same merge as the streaming path, so the two cannot diverge
+        return list(self._merge_gaps(transcription['segments'], min_gap))
+
+    @staticmethod
+    def _merge_gaps(
+        segments: Iterable[Dict],
+        min_gap: float
+    ) -> Iterator[Tuple[float, float]]:
+        """Merge segments closer than min_gap, yielding each finished span"""
         current_start = None
         current_end = None
 
-        for segment in transcription['segments']:
+        for segment in segments:
             start = segment['start']
             end = segment['end']
 
@@ -129,16 +573,35 @@ class WhisperHandler:
                 if start - current_end <= min_gap:
                     current_end = end
                 else:
-                    # Save current segment and start new one
-                    segments.append((current_start, current_end))
+                    # Emit current segment and start new one
+                    yield (current_start, current_end)
                     current_start = start
                     current_end = end
 
         # Don't forget the last segment
         if current_start is not None:
-            segments.append((current_start, current_end))
+            yield (current_start, current_end)
 
-        return segments
+    def stream_speech_segments(
+        self,
+        audio: Union[str, np.ndarray],
+        min_gap: float = 2.0
+    ) -> Iterator[Tuple[float, float]]:
+        """
+        Transcribe audio and yield merged speech segments as they complete
+
+        Only the span being merged is held in memory, so each segment is
+        available as soon as the following gap has been decoded.
+
+        Args:
+            audio: Audio file path or 16 kHz mono float32 samples (model
+                must be loaded)
+            min_gap: Minimum gap between speech segments
+
+        Returns:
+            Iterator of (start, end) tuples for speech segments
+        """
+        return self._merge_gaps(self._iter_segments(audio, min_gap), min_gap)
 
     def detect_speech_from_video(
         self,
@@ -159,35 +622,30 @@ class WhisperHandler:
         Returns:
             List of (start, end) tuples for speech segments
         """
-        # Create temporary audio file
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_audio:
-            temp_audio_path = temp_audio.name
-
-        try:
-            # Extract audio from video
-            if not ffmpeg_handler.extract_audio(video_path, temp_audio_path, progress_callback):
-                return []
+        if not self._ensure_model(progress_callback):
+            return []
 
-            # Transcribe audio
-            transcription = self.transcribe_audio(temp_audio_path, progress_callback)
-            if not transcription:
-                return []
+        # Decode audio into memory instead of a temporary WAV file
+        audio = ffmpeg_handler.read_audio(video_path, progress_callback)
+        if audio is None:
+            return []
 
-            # Extract speech segments
-            segments = self.get_speech_segments(transcription, min_gap)
+        if progress_callback:
+            progress_callback("Transcribing audio with Whisper AI...")
 
+        # Merge gaps while decoding instead of keeping the transcript
+        try:
+            with self._decode_guard():
+                segments = list(self.stream_speech_segments(audio, min_gap))
+        except Exception as e:
             if progress_callback:
-                progress_callback(f"Found {len(segments)} speech segments")
+                progress_callback(f"Error transcribing audio: {str(e)}")
+            return []
 
-            return segments
+        if progress_callback:
+            progress_callback(f"Found {len(segments)} speech segments")
 
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_audio_path):
-                try:
-                    os.unlink(temp_audio_path)
-                except:
-                    pass
+        return segments
 
     def get_transcript_text(self, transcription: Dict) -> str:
         """Get full transcript text from transcription result"""
@@ -219,15 +677,19 @@ class WhisperHandler:
                 return True
 
             elif format == 'srt' and 'segments' in transcription:
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    for i, segment in enumerate(transcription['segments'], 1):
-                        start = self._format_timestamp(segment['start'])
-                        end = self._format_timestamp(segment['end'])
-                        text = segment['text'].strip()
-
-                        f.write(f"{i}\n")
-                        f.write(f"{start} --> {end}\n")
-                        f.write(f"{text}\n\n")
+                segments = transcription['segments']
+                starts = self._format_timestamps([seg['start'] for seg in segments])
+                ends = self._format_timestamps([seg['end'] for seg in segments])
+
+                # Encode the whole body once and write it in a single call
+                body = ''.join(
+                    f"{i}\n{start} --> {end}\n{segment['text'].strip()}\n\n"
+                    for i, (segment, start, end) in enumerate(
+                        zip(segments, starts, ends), 1
+                    )
+                )
+                with open(output_path, 'wb') as f:
+                    f.write(body.encode('utf-8'))
                 return True
 
             return False
@@ -236,6 +698,21 @@ class WhisperHandler:
             print(f"Error exporting transcript: {e}")
             return False
 
+    @staticmethod
+    def _format_timestamps(seconds: List[float]) -> List[str]:
+        """Format many seconds values to SRT timestamps at once"""
+        t = np.asarray(seconds, dtype=np.float64)
+        hours = (t // 3600).astype(np.int64)
+        minutes = ((t % 3600) // 60).astype(np.int64)
+        secs = (t % 60).astype(np.int64)
+        millis = ((t % 1) * 1000).astype(np.int64)
+        return [
+            f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+            for h, m, s, ms in zip(
+                hours.tolist(), minutes.tolist(), secs.tolist(), millis.tolist()
+            )
+        ]
+
     @staticmethod
     def _format_timestamp(seconds: float) -> str:
         """Format seconds to SRT timestamp format (HH:MM:SS,mmm)"""
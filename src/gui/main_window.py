@@ -3,14 +3,24 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
+import os
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ..utils.config import Config
 from ..utils.file_utils import is_video_file, check_ffmpeg_installed, format_duration, get_video_duration
 from ..core.processor import VideoProcessor
+from ..core.whisper_handler import WhisperHandler
 from .progress_window import ProgressWindow
 
+# Whisper checkpoints offered in the model selector
+WHISPER_MODELS = ["base", "small", "distil-small.en", "distil-large-v3"]
+
+# Pre-warm only once the mode/model selection has been still this long, so
+# browsing the model list does not download and load every entry
+_PREWARM_DELAY_MS = 1500
+
 
 class MainWindow:
     """Main application window"""
@@ -19,12 +29,21 @@ class MainWindow:
         self.root = root
         self.config = Config()
         self.file_queue: List[str] = []
+        # Mirrors file_queue for O(1) duplicate checks
+        self._queue_set: Set[str] = set()
         self.processing = False
         self.processor: Optional[VideoProcessor] = None
+        self._prewarm_job: Optional[str] = None
 
         self._setup_window()
         self._create_widgets()
         self._check_dependencies()
+        # Import the Whisper backend (torch etc.) off the UI thread so it is
+        # hot before the first Whisper or Hybrid run
+        threading.Thread(
+            target=self._whisper_handler().is_whisper_available,
+            daemon=True
+        ).start()
         self._apply_config()
 
     def _setup_window(self):
@@ -44,6 +63,9 @@ class MainWindow:
 
     def _create_widgets(self):
         """Create all GUI widgets"""
+        # Read settings once for all widget defaults
+        cfg = self.config.snapshot()
+
         # Main container
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -71,16 +93,16 @@ class MainWindow:
         self._create_file_queue(main_frame, row=3)
 
         # Processing mode
-        self._create_processing_mode(main_frame, row=4)
+        self._create_processing_mode(main_frame, cfg, row=4)
 
         # Settings
-        self._create_settings(main_frame, row=5)
+        self._create_settings(main_frame, cfg, row=5)
 
         # Export options
-        self._create_export_options(main_frame, row=6)
+        self._create_export_options(main_frame, cfg, row=6)
 
         # Output folder
-        self._create_output_folder(main_frame, row=7)
+        self._create_output_folder(main_frame, cfg, row=7)
 
         # Presets and process buttons
         self._create_action_buttons(main_frame, row=8)
@@ -150,12 +172,14 @@ class MainWindow:
             command=self._clear_queue
         ).pack(side=tk.LEFT, padx=2)
 
-    def _create_processing_mode(self, parent, row):
+    def _create_processing_mode(self, parent, cfg, row):
         """Create processing mode selector"""
         mode_frame = ttk.LabelFrame(parent, text="Processing Mode", padding="10")
         mode_frame.grid(row=row, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
 
-        self.mode_var = tk.StringVar(value=self.config.get('processing_mode', 'ffmpeg'))
+        self.mode_var = tk.StringVar(value=cfg.get('processing_mode', 'ffmpeg'))
+        # Fires for radio clicks, presets and saved config alike
+        self.mode_var.trace_add('write', lambda *args: self._on_mode_changed())
 
         modes = [
             ('ffmpeg', 'FFmpeg Only (Fastest - 5-10 min for 4hr video)'),
@@ -171,7 +195,62 @@ class MainWindow:
                 value=value
             ).grid(row=0, column=i, padx=10, sticky=tk.W)
 
-    def _create_settings(self, parent, row):
+        # Whisper model; distil-* variants decode about 2x faster on English
+        model_frame = ttk.Frame(mode_frame)
+        model_frame.grid(
+            row=1, column=0, columnspan=len(modes), sticky=tk.W, padx=10, pady=(5, 0)
+        )
+
+        ttk.Label(model_frame, text="Whisper Model:").pack(side=tk.LEFT, padx=(0, 10))
+        self.whisper_model_var = tk.StringVar(value=cfg.get('whisper_model', 'base'))
+        model_combo = ttk.Combobox(
+            model_frame,
+            textvariable=self.whisper_model_var,
+            values=WHISPER_MODELS,
+            state='readonly',
+            width=18
+        )
+        model_combo.pack(side=tk.LEFT)
+        model_combo.bind('<<ComboboxSelected>>', lambda e: self._on_mode_changed())
+
+    def _on_mode_changed(self):
+        """Schedule a Whisper pre-warm when a Whisper-based mode is selected"""
+        if self._prewarm_job is not None:
+            self.root.after_cancel(self._prewarm_job)
+            self._prewarm_job = None
+
+        if self.mode_var.get() not in ('whisper', 'hybrid'):
+            return
+
+        self._prewarm_job = self.root.after(_PREWARM_DELAY_MS, self._prewarm_whisper)
+
+    def _prewarm_whisper(self):
+        """Load the selected Whisper model, dropping any other cached one"""
+        self._prewarm_job = None
+        self._evict_unselected_models()
+
+        # load_model checks backend availability on the worker thread too
+        whisper = self._whisper_handler()
+        if whisper.model is None:
+            threading.Thread(target=whisper.load_model, daemon=True).start()
+
+    def _evict_unselected_models(self):
+        """Let models other than the selected one be freed"""
+        WhisperHandler.evict_others(
+            self.whisper_model_var.get(),
+            self.config.get('whisper_compute_type', 'auto')
+        )
+
+    def _whisper_handler(self) -> WhisperHandler:
+        """Get the shared Whisper handler for the selected model"""
+        return WhisperHandler.get(
+            self.whisper_model_var.get(),
+            self.config.get('whisper_compute_type', 'auto'),
+            batch_size=self.config.get('whisper_batch_size', 8),
+            use_compile=self.config.get('whisper_compile', False)
+        )
+
+    def _create_settings(self, parent, cfg, row):
         """Create settings controls"""
         settings_frame = ttk.LabelFrame(parent, text="Settings", padding="10")
         settings_frame.grid(row=row, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
@@ -181,7 +260,7 @@ class MainWindow:
         ttk.Label(settings_frame, text="Silence Threshold:").grid(
             row=0, column=0, sticky=tk.W, padx=(0, 10)
         )
-        self.threshold_var = tk.IntVar(value=int(self.config.get('silence_threshold_db', -30)))
+        self.threshold_var = tk.IntVar(value=int(cfg.get('silence_threshold_db', -30)))
         threshold_frame = ttk.Frame(settings_frame)
         threshold_frame.grid(row=0, column=1, sticky=(tk.W, tk.E))
         ttk.Scale(
@@ -202,7 +281,7 @@ class MainWindow:
         ttk.Label(settings_frame, text="Min Silence Duration:").grid(
             row=1, column=0, sticky=tk.W, padx=(0, 10), pady=(5, 0)
         )
-        self.duration_var = tk.DoubleVar(value=self.config.get('min_silence_duration', 2.0))
+        self.duration_var = tk.DoubleVar(value=cfg.get('min_silence_duration', 2.0))
         duration_frame = ttk.Frame(settings_frame)
         duration_frame.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=(5, 0))
         ttk.Scale(
@@ -223,7 +302,7 @@ class MainWindow:
         ttk.Label(settings_frame, text="Padding:").grid(
             row=2, column=0, sticky=tk.W, padx=(0, 10), pady=(5, 0)
         )
-        self.padding_var = tk.DoubleVar(value=self.config.get('padding_seconds', 0.5))
+        self.padding_var = tk.DoubleVar(value=cfg.get('padding_seconds', 0.5))
         padding_frame = ttk.Frame(settings_frame)
         padding_frame.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=(5, 0))
         ttk.Scale(
@@ -240,15 +319,15 @@ class MainWindow:
         ).pack(side=tk.LEFT, padx=(5, 0))
         ttk.Label(padding_frame, text="sec").pack(side=tk.LEFT)
 
-    def _create_export_options(self, parent, row):
+    def _create_export_options(self, parent, cfg, row):
         """Create export options"""
         export_frame = ttk.LabelFrame(parent, text="Export Options", padding="10")
         export_frame.grid(row=row, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
 
-        self.export_merged_var = tk.BooleanVar(value=self.config.get('export_merged', True))
-        self.export_clips_var = tk.BooleanVar(value=self.config.get('export_clips', False))
-        self.export_timestamps_var = tk.BooleanVar(value=self.config.get('export_timestamps', True))
-        self.export_xml_var = tk.BooleanVar(value=self.config.get('export_xml', False))
+        self.export_merged_var = tk.BooleanVar(value=cfg.get('export_merged', True))
+        self.export_clips_var = tk.BooleanVar(value=cfg.get('export_clips', False))
+        self.export_timestamps_var = tk.BooleanVar(value=cfg.get('export_timestamps', True))
+        self.export_xml_var = tk.BooleanVar(value=cfg.get('export_xml', False))
 
         ttk.Checkbutton(
             export_frame,
@@ -274,7 +353,7 @@ class MainWindow:
             variable=self.export_xml_var
         ).grid(row=1, column=1, sticky=tk.W, padx=10, pady=(5, 0))
 
-    def _create_output_folder(self, parent, row):
+    def _create_output_folder(self, parent, cfg, row):
         """Create output folder selector"""
         folder_frame = ttk.Frame(parent)
         folder_frame.grid(row=row, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
@@ -282,7 +361,7 @@ class MainWindow:
 
         ttk.Label(folder_frame, text="Output Folder:").grid(row=0, column=0, padx=(0, 10))
 
-        self.output_folder_var = tk.StringVar(value=self.config.get('output_folder', './output'))
+        self.output_folder_var = tk.StringVar(value=cfg.get('output_folder', './output'))
         output_entry = ttk.Entry(folder_frame, textvariable=self.output_folder_var)
         output_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 10))
 
@@ -364,6 +443,7 @@ class MainWindow:
 
     def _apply_config(self):
         """Apply saved configuration"""
+        self.whisper_model_var.set(self.config.get('whisper_model', 'base'))
         self.mode_var.set(self.config.get('processing_mode', 'ffmpeg'))
         self.threshold_var.set(int(self.config.get('silence_threshold_db', -30)))
         self.duration_var.set(self.config.get('min_silence_duration', 2.0))
@@ -379,11 +459,16 @@ class MainWindow:
             ]
         )
 
+        new_files = []
         for file in files:
-            if file not in self.file_queue and is_video_file(file):
-                self.file_queue.append(file)
-                filename = Path(file).name
-                self.queue_listbox.insert(tk.END, filename)
+            if file not in self._queue_set and is_video_file(file):
+                self._queue_set.add(file)
+                new_files.append(file)
+
+        # One insert call so the listbox redraws once, not per file
+        if new_files:
+            self.file_queue.extend(new_files)
+            self.queue_listbox.insert(tk.END, *(Path(file).name for file in new_files))
 
         self.status_var.set(f"{len(self.file_queue)} file(s) in queue")
 
@@ -392,13 +477,14 @@ class MainWindow:
         selection = self.queue_listbox.curselection()
         if selection:
             index = selection[0]
-            self.file_queue.pop(index)
+            self._queue_set.discard(self.file_queue.pop(index))
             self.queue_listbox.delete(index)
             self.status_var.set(f"{len(self.file_queue)} file(s) in queue")
 
     def _clear_queue(self):
         """Clear all files from queue"""
         self.file_queue.clear()
+        self._queue_set.clear()
         self.queue_listbox.delete(0, tk.END)
         self.status_var.set("Queue cleared")
 
@@ -452,6 +538,7 @@ class MainWindow:
         # Save current settings to config
         self.config.update({
             'processing_mode': self.mode_var.get(),
+            'whisper_model': self.whisper_model_var.get(),
             'silence_threshold_db': float(self.threshold_var.get()),
             'min_silence_duration': self.duration_var.get(),
             'padding_seconds': self.padding_var.get(),
@@ -462,6 +549,8 @@ class MainWindow:
             'output_folder': self.output_folder_var.get()
         })
         self.config.save()
+        # Only the model this run uses stays cached
+        self._evict_unselected_models()
 
         # Start processing in background thread
         self.processing = True
@@ -469,31 +558,66 @@ class MainWindow:
 
         progress_window = ProgressWindow(self.root, len(self.file_queue))
 
-        def process_thread():
-            try:
-                self.processor = VideoProcessor(self.config.config)
+        video_files = list(self.file_queue)
+        output_folder = self.output_folder_var.get()
+        workers = max(1, min(len(video_files), self.config.get('parallel_videos', 2)))
 
-                for i, video_file in enumerate(self.file_queue, 1):
-                    if not self.processing:
-                        break
+        def process_file(i, video_file):
+            if not self.processing:
+                return None
 
-                    filename = Path(video_file).name
-                    progress_window.update_current_file(filename, i)
+            filename = Path(video_file).name
+            progress_window.update_current_file(filename, i)
 
-                    result = self.processor.process_video(
-                        video_file,
-                        self.output_folder_var.get(),
-                        progress_callback=progress_window.update_status
-                    )
+            status_callback = progress_window.update_status
+            if workers > 1:
+                status_callback = lambda status: progress_window.update_status(
+                    f"{filename}: {status}"
+                )
+
+            return self.processor.process_video(
+                video_file,
+                output_folder,
+                progress_callback=status_callback
+            )
 
-                    if result['success']:
-                        saved_time = format_duration(result.get('time_saved', 0))
-                        progress_window.add_result(
-                            f"✓ {filename}: Saved {saved_time}"
-                        )
-                    else:
-                        error = result.get('error', 'Unknown error')
-                        progress_window.add_result(f"✗ {filename}: {error}")
+        def process_thread():
+            try:
+                # One processor, and so one Whisper model, shared by all
+                # workers; FFmpeg threads are split between them
+                processor_config = self.config.snapshot()
+                if not processor_config.get('ffmpeg_threads'):
+                    processor_config['ffmpeg_threads'] = max(
+                        1, (os.cpu_count() or 1) // workers
+                    )
+                self.processor = VideoProcessor(processor_config)
+                self.processor.reset()
+
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(process_file, i, video_file): video_file
+                        for i, video_file in enumerate(video_files, 1)
+                    }
+
+                    for future in as_completed(futures):
+                        filename = Path(futures[future]).name
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            result = {'success': False, 'error': str(e)}
+
+                        # Skipped after cancel
+                        if result is None:
+                            continue
+
+                        if result['success']:
+                            saved_time = format_duration(result.get('time_saved', 0))
+                            progress_window.add_result(
+                                f"✓ {filename}: Saved {saved_time}"
+                            )
+                        else:
+                            error = result.get('error', 'Unknown error')
+                            progress_window.add_result(f"✗ {filename}: {error}")
 
                 progress_window.processing_complete()
 
@@ -2,61 +2,143 @@
 
 import json
 import os
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+
+# Optional faster JSON codec; falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@dataclass(slots=True)
+class Settings:
+    """Typed application settings with their defaults"""
+
+    processing_mode: str = "ffmpeg"
+    silence_threshold_db: float = -30
+    min_silence_duration: float = 2.0
+    padding_seconds: float = 0.5
+    whisper_model: str = "base"
+    whisper_compute_type: str = "auto"
+    whisper_batch_size: int = 8
+    whisper_compile: bool = False
+    export_clips: bool = True
+    export_merged: bool = True
+    export_timestamps: bool = True
+    export_xml: bool = False
+    reencode_clips: bool = False
+    frame_exact_cuts: bool = False
+    output_folder: str = "./output"
+    ffmpeg_path: str = "ffmpeg"
+    encoder_preset: str = "veryfast"
+    hardware_encoding: bool = True
+    ffmpeg_threads: int = 0
+    parallel_videos: int = 2
+    threads: int = 4
+    window_geometry: str = "900x700"
+
+_SETTING_NAMES = frozenset(field.name for field in fields(Settings))
 
 class Config:
     """Manages application configuration"""
 
-    DEFAULT_CONFIG = {
-        "processing_mode": "ffmpeg",
-        "silence_threshold_db": -30,
-        "min_silence_duration": 2.0,
-        "padding_seconds": 0.5,
-        "whisper_model": "base",
-        "export_clips": True,
-        "export_merged": True,
-        "export_timestamps": True,
-        "export_xml": False,
-        "output_folder": "./output",
-        "ffmpeg_path": "ffmpeg",
-        "threads": 4,
-        "window_geometry": "900x700"
-    }
+    DEFAULT_CONFIG = asdict(Settings())
 
     def __init__(self, config_path: str = "config/settings.json"):
         self.config_path = Path(config_path)
-        self.config: Dict[str, Any] = self.DEFAULT_CONFIG.copy()
+        # Known keys live in slotted fields; hot paths read cfg.s.threads
+        self.s = Settings()
+        # Keys in the settings file that Settings does not define
+        self._extra: Dict[str, Any] = {}
         self.load()
 
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """Read-only view of all configuration values
+
+        Values are copied out of Settings, so writes would be lost; the
+        view makes them raise instead. Use set() or update() to change
+        values, and snapshot() for a mutable copy.
+        """
+        return MappingProxyType(self.snapshot())
+
     def load(self) -> None:
         """Load configuration from file"""
+        loaded_config = {}
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r') as f:
-                    loaded_config = json.load(f)
-                    self.config.update(loaded_config)
+                # Both parsers take bytes, skipping the text decoding layer
+                loads = orjson.loads if orjson is not None else json.loads
+                loaded_config = loads(self.config_path.read_bytes())
+                if not isinstance(loaded_config, dict):
+                    raise ValueError(
+                        f"expected a JSON object, got {type(loaded_config).__name__}"
+                    )
             except Exception as e:
+                loaded_config = {}
                 print(f"Error loading config: {e}")
                 print("Using default configuration")
 
+        # Current values, then the file
+        merged = {**self.snapshot(), **loaded_config}
+        self.s = Settings(**{k: v for k, v in merged.items() if k in _SETTING_NAMES})
+        self._extra = {k: v for k, v in merged.items() if k not in _SETTING_NAMES}
+
     def save(self) -> None:
         """Save configuration to file"""
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+
+            # Write a sibling file and swap it in, so an interrupted save
+            # never leaves a truncated settings file
+            temp_path = self.config_path.with_suffix('.json.tmp')
+            if orjson is not None:
+                temp_path.write_bytes(orjson.dumps(self.snapshot(), option=orjson.OPT_INDENT_2))
+            else:
+                with open(temp_path, 'w') as f:
+                    json.dump(self.snapshot(), f, indent=2)
+            os.replace(temp_path, self.config_path)
         except Exception as e:
             print(f"Error saving config: {e}")
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
-        return self.config.get(key, default)
+        if key in _SETTING_NAMES:
+            return getattr(self.s, key)
+        return self._extra.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """Set configuration value"""
-        self.config[key] = value
+        if key in _SETTING_NAMES:
+            setattr(self.s, key, value)
+        else:
+            self._extra[key] = value
 
     def update(self, updates: Dict[str, Any]) -> None:
         """Update multiple configuration values"""
-        self.config.update(updates)
+        for key, value in updates.items():
+            self.set(key, value)
+
+    def __getitem__(self, key: str) -> Any:
+        """Get configuration value, raising KeyError if missing"""
+        if key in _SETTING_NAMES:
+            return getattr(self.s, key)
+        return self._extra[key]
+
+    def __getattr__(self, name: str) -> Any:
+        """Read settings as attributes, e.g. cfg.threads
+
+        Only called when normal lookup fails, so Config's own members
+        always take precedence.
+        """
+        settings = self.__dict__.get('s')
+        if settings is not None and name in _SETTING_NAMES:
+            return getattr(settings, name)
+        raise AttributeError(name)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a shallow copy of the current configuration as a plain dict"""
+        return {**asdict(self.s), **self._extra}
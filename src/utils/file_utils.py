@@ -1,39 +1,55 @@
 """File utility functions for StreamCut Pro"""
 
+import asyncio
 import os
 import subprocess
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
-# Supported video formats
-SUPPORTED_FORMATS = {
+# Supported video formats (immutable, so it is built once at import)
+SUPPORTED_FORMATS = frozenset({
     '.mp4', '.mkv', '.avi', '.mov', '.flv',
     '.wmv', '.webm', '.m4v', '.mpg', '.mpeg'
-}
+})
+
+# Upper bound on ffprobe children alive at once in get_video_durations
+_MAX_CONCURRENT_PROBES = 16
+
+# check_ffmpeg_installed result, probed once per process
+_ffmpeg_cache: Optional[Tuple[bool, Optional[str]]] = None
 
 def is_video_file(file_path: str) -> bool:
     """Check if file is a supported video format"""
-    return Path(file_path).suffix.lower() in SUPPORTED_FORMATS
+    # Plain string slicing; building a Path per file dominates directory scans
+    i = file_path.rfind('.')
+    return i >= 0 and file_path[i:].lower() in SUPPORTED_FORMATS
 
 def check_ffmpeg_installed() -> Tuple[bool, Optional[str]]:
     """
     Check if FFmpeg is installed and accessible
 
+    The result is cached for the rest of the process.
+
     Returns:
         Tuple of (is_installed, version_string)
     """
+    global _ffmpeg_cache
+    if _ffmpeg_cache is None:
+        _ffmpeg_cache = _probe_ffmpeg()
+    return _ffmpeg_cache
+
+def _probe_ffmpeg() -> Tuple[bool, Optional[str]]:
+    """Run ffmpeg -version once"""
     try:
-        result = subprocess.run(
+        # Only stdout is read; decode just the first line
+        output = subprocess.check_output(
             ['ffmpeg', '-version'],
-            capture_output=True,
-            text=True,
+            stderr=subprocess.DEVNULL,
             timeout=5
         )
-        if result.returncode == 0:
-            version_line = result.stdout.split('\n')[0]
-            return True, version_line
-        return False, None
-    except (FileNotFoundError, subprocess.TimeoutExpired):
+        version_line = output.split(b'\n', 1)[0].decode('ascii', 'replace')
+        return True, version_line
+    except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
         return False, None
 
 def get_video_duration(video_path: str) -> Optional[float]:
@@ -54,16 +70,82 @@ def get_video_duration(video_path: str) -> Optional[float]:
                 '-of', 'default=noprint_wrappers=1:nokey=1',
                 video_path
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=10
         )
         if result.returncode == 0:
-            return float(result.stdout.strip())
+            # float() parses bytes and ignores surrounding whitespace
+            return float(result.stdout)
         return None
     except (FileNotFoundError, ValueError, subprocess.TimeoutExpired):
         return None
 
+async def get_video_duration_async(video_path: str) -> Optional[float]:
+    """
+    Get video duration in seconds using FFprobe without blocking a thread
+
+    Args:
+        video_path: Path to video file
+
+    Returns:
+        Duration in seconds or None if error
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            'ffprobe', '-v', 'error',
+            '-show_entries', 'format=duration',
+            '-of', 'default=noprint_wrappers=1:nokey=1',
+            video_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+    except FileNotFoundError:
+        return None
+
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=10)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return None
+
+    if process.returncode != 0:
+        return None
+    try:
+        return float(stdout)
+    except ValueError:
+        return None
+
+def get_video_durations(video_paths: List[str]) -> Dict[str, Optional[float]]:
+    """
+    Get durations for many videos, running FFprobe processes concurrently
+
+    All probes run on one event loop, so N files cost about one FFprobe
+    startup rather than N.
+
+    Args:
+        video_paths: Paths to video files
+
+    Returns:
+        Dict mapping each path to its duration in seconds, or None if error
+    """
+    if not video_paths:
+        return {}
+
+    async def probe_all():
+        # Probes mostly wait on process startup, so the cap is about not
+        # flooding the system with children rather than about cores
+        limit = asyncio.Semaphore(_MAX_CONCURRENT_PROBES)
+
+        async def probe(path):
+            async with limit:
+                return await get_video_duration_async(path)
+
+        return await asyncio.gather(*(probe(path) for path in video_paths))
+
+    return dict(zip(video_paths, asyncio.run(probe_all())))
+
 def format_duration(seconds: float) -> str:
     """
     Format seconds into HH:MM:SS string
@@ -74,10 +156,10 @@ def format_duration(seconds: float) -> str:
     Returns:
         Formatted string like "01:23:45"
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    # Integer divmod chain; called per segment when writing reports
+    hours, rem = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rem, 60)
+    return "%02d:%02d:%02d" % (hours, minutes, secs)
 
 def ensure_output_dir(output_path: str) -> Path:
     """
@@ -93,29 +175,46 @@ def ensure_output_dir(output_path: str) -> Path:
     path.mkdir(parents=True, exist_ok=True)
     return path
 
-def get_unique_filename(base_path: str, extension: str = "") -> str:
+def get_unique_filename(
+    base_path: str,
+    extension: str = "",
+    existing: Optional[Set[str]] = None
+) -> str:
     """
     Generate unique filename by adding number suffix if file exists
 
+    The parent directory is listed once and candidates are checked in
+    memory instead of stat-ing each one. Names are compared casefolded so
+    a match on a case-insensitive filesystem (Windows, macOS) still counts
+    as taken.
+
     Args:
         base_path: Base file path without extension
         extension: File extension (including dot)
+        existing: Optional set of casefolded names already in the
+            directory; reused across calls and updated with the returned name
 
     Returns:
         Unique file path
     """
     counter = 1
     if not extension:
-        path = Path(base_path)
-        extension = path.suffix
-        base_path = str(path.with_suffix(''))
-
-    output_path = f"{base_path}{extension}"
-    while os.path.exists(output_path):
-        output_path = f"{base_path}_{counter}{extension}"
+        base_path, extension = os.path.splitext(base_path)
+
+    parent, base_name = os.path.split(base_path)
+    if existing is None:
+        try:
+            existing = {entry.casefold() for entry in os.listdir(parent or '.')}
+        except OSError:
+            existing = set()
+
+    name = f"{base_name}{extension}"
+    while name.casefold() in existing:
+        name = f"{base_name}_{counter}{extension}"
         counter += 1
 
-    return output_path
+    existing.add(name.casefold())
+    return os.path.join(parent, name)
 
 def get_file_size_mb(file_path: str) -> float:
     """Get file size in megabytes"""
@@ -123,3 +222,21 @@ def get_file_size_mb(file_path: str) -> float:
         return os.path.getsize(file_path) / (1024 * 1024)
     except OSError:
         return 0.0
+
+def iter_video_files(folder: str) -> Iterator[Tuple[str, int]]:
+    """
+    Yield supported video files in a folder together with their sizes
+
+    os.scandir entries carry cached stat data on many platforms, so this
+    avoids a separate getsize() call per file.
+
+    Args:
+        folder: Directory to scan (not recursive)
+
+    Yields:
+        (path, size_in_bytes) tuples
+    """
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if is_video_file(entry.name) and entry.is_file():
+                yield entry.path, entry.stat().st_size
@@ -0,0 +1,98 @@
+"""Tests for FFmpegHandler clip splitting"""
+
+import shutil
+import subprocess
+
+import pytest
+
+from src.core.ffmpeg_handler import FFmpegHandler
+
+try:
+    import av
+except ImportError:
+    av = None
+
+requires_ffmpeg = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None or av is None,
+    reason="ffmpeg and PyAV are required"
+)
+
+FPS = 25
+
+
+def _make_source(path):
+    """Write a 12 s test video with a tone on its audio track"""
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error", "-y",
+            "-f", "lavfi", "-i", f"testsrc=size=160x120:rate={FPS}:duration=12",
+            "-f", "lavfi", "-i", "sine=frequency=440:duration=12",
+            "-c:v", "libx264", "-g", "250", "-c:a", "aac",
+            str(path)
+        ],
+        check=True
+    )
+
+
+def _video_duration(path):
+    """Duration of a file's video stream from its decoded frame count"""
+    with av.open(str(path)) as container:
+        stream = container.streams.video[0]
+        return sum(1 for _ in container.decode(stream)) / FPS
+
+
+@requires_ffmpeg
+def test_clip_starts_match_segment_times(tmp_path):
+    source = tmp_path / "source.mp4"
+    _make_source(source)
+
+    keep_segments = [(1.0, 3.0), (5.0, 6.5), (8.0, 11.0)]
+    handler = FFmpegHandler(hardware_encoding=False)
+    created = handler.cut_video_and_clips(
+        str(source),
+        keep_segments,
+        str(tmp_path / "merged.mp4"),
+        str(tmp_path / "clips"),
+        "source",
+        padding=0.0,
+        frame_exact=True
+    )
+
+    assert len(created) == len(keep_segments) + 1
+    clips = created[1:]
+
+    # Each clip starts where segment_times split the edited timeline
+    expected_start = 0.0
+    actual_start = 0.0
+    for (start, end), clip in zip(keep_segments, clips):
+        assert actual_start == pytest.approx(expected_start, abs=1 / FPS)
+        expected_start += end - start
+        actual_start += _video_duration(clip)
+
+    assert actual_start == pytest.approx(expected_start, abs=1 / FPS)
+
+
+@pytest.mark.parametrize("encoder, forced_idr", [
+    ("h264_nvenc", True),
+    ("libx264", False),
+])
+def test_forced_idr_only_for_nvenc(tmp_path, monkeypatch, encoder, forced_idr):
+    handler = FFmpegHandler()
+    handler._encoder = (encoder, [])
+    captured = {}
+
+    def fake_run_filter_graph(video_path, filter_complex, output_args, *args):
+        captured["args"] = output_args
+        return True
+
+    monkeypatch.setattr(handler, "_run_filter_graph", fake_run_filter_graph)
+    handler.cut_video_and_clips(
+        "source.mp4",
+        [(1.0, 3.0), (5.0, 6.5)],
+        str(tmp_path / "merged.mp4"),
+        str(tmp_path / "clips"),
+        "source",
+        frame_exact=True
+    )
+
+    assert ("-forced-idr" in captured["args"]) is forced_idr